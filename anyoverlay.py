@@ -1,11 +1,40 @@
 import sys
 import json
 import os
+import gc
+import hashlib
 import ctypes
+import atexit
+import signal
+import operator
+from collections import OrderedDict
 from PyQt5 import QtWidgets, QtGui, QtCore
 
+try:
+    import orjson
+
+    def settings_dumps(settings):
+        return orjson.dumps(settings, option=orjson.OPT_SORT_KEYS)
+
+    settings_loads = orjson.loads
+except ImportError:
+    def settings_dumps(settings):
+        return json.dumps(settings, sort_keys=True, separators=(',', ':')).encode()
+
+    settings_loads = json.loads
+
+try:
+    from PIL import Image as PILImage, ImageOps
+except ImportError:
+    PILImage = None
+
+try:
+    import keyboard
+except ImportError:
+    keyboard = None
+
 if sys.platform == "win32":
-    from ctypes.wintypes import HWND, LONG, DWORD, BOOL
+    from ctypes.wintypes import HWND, LONG, DWORD, BOOL, UINT, MSG
 
     user32 = ctypes.WinDLL('user32', use_last_error=True)
 
@@ -26,91 +55,498 @@ if sys.platform == "win32":
     SetLayeredWindowAttributes.restype = BOOL
     SetLayeredWindowAttributes.argtypes = [HWND, DWORD, ctypes.c_byte, DWORD]
 
-class CachedImageRenderer:
+    WM_HOTKEY = 0x0312
+    MOD_ALT = 0x0001
+    MOD_CONTROL = 0x0002
+    MOD_SHIFT = 0x0004
+    MOD_WIN = 0x0008
+    MOD_NOREPEAT = 0x4000
+    HOTKEY_ID = 1
+
+    RegisterHotKey = user32.RegisterHotKey
+    RegisterHotKey.restype = BOOL
+    RegisterHotKey.argtypes = [HWND, ctypes.c_int, UINT, UINT]
+
+    UnregisterHotKey = user32.UnregisterHotKey
+    UnregisterHotKey.restype = BOOL
+    UnregisterHotKey.argtypes = [HWND, ctypes.c_int]
+
+    HOTKEY_MODIFIERS = {'ctrl': MOD_CONTROL, 'control': MOD_CONTROL, 'alt': MOD_ALT,
+                        'shift': MOD_SHIFT, 'win': MOD_WIN, 'windows': MOD_WIN}
+    HOTKEY_NAMED_KEYS = {'space': 0x20, 'enter': 0x0D, 'tab': 0x09, 'esc': 0x1B, 'escape': 0x1B,
+                         'backspace': 0x08, 'insert': 0x2D, 'delete': 0x2E, 'home': 0x24, 'end': 0x23,
+                         'page up': 0x21, 'page down': 0x22, 'left': 0x25, 'up': 0x26,
+                         'right': 0x27, 'down': 0x28}
+
+    def parse_hotkey(hotkey):
+        """Translate a 'ctrl+alt+o' style hotkey into (MOD_* flags, virtual-key code); None if unsupported"""
+        modifiers = 0
+        vk = None
+        for part in hotkey.lower().split('+'):
+            part = part.strip()
+            if part in HOTKEY_MODIFIERS:
+                modifiers |= HOTKEY_MODIFIERS[part]
+            elif vk is not None:
+                return None
+            elif len(part) == 1 and part.isascii() and part.isalnum():
+                vk = ord(part.upper())
+            elif part[:1] == 'f' and part[1:].isdigit() and 1 <= int(part[1:]) <= 24:
+                vk = 0x6F + int(part[1:])
+            elif part in HOTKEY_NAMED_KEYS:
+                vk = HOTKEY_NAMED_KEYS[part]
+            else:
+                return None
+        if vk is None:
+            return None
+        return modifiers, vk
+
+    def update_ex_style(hwnd, add=0, remove=0):
+        """Read-modify-write a window's extended style in one place"""
+        ex_style = GetWindowLong(hwnd, GWL_EXSTYLE)
+        SetWindowLong(hwnd, GWL_EXSTYLE, (ex_style | add) & ~remove)
+
+DARK_STYLESHEET = """
+QWidget {
+    background-color: #2b2b2b;
+    color: #ffffff;
+    font-family: Arial;
+    font-size: 10pt;
+}
+QTabWidget::pane {
+    border: 1px solid #555555;
+    border-radius: 4px;
+    background-color: #2b2b2b;
+}
+QTabBar::tab {
+    background-color: #3c3f41;
+    color: #ffffff;
+    padding: 5px;
+    border: 1px solid #3c3f41;
+    border-bottom-color: #2b2b2b;
+    min-width: 100px;
+}
+QTabBar::tab:selected {
+    background-color: #4b4b4b;
+    border-bottom-color: #4b4b4b;
+}
+QTabBar::tab:hover {
+    background-color: #4b4b4b;
+}
+QPushButton {
+    background-color: #3c3f41;
+    color: #ffffff;
+    border: none;
+    padding: 5px;
+}
+QPushButton:hover {
+    background-color: #4b4b4b;
+}
+QLineEdit, QComboBox {
+    background-color: #3c3f41;
+    color: #ffffff;
+    border: 1px solid #555555;
+    padding: 2px;
+}
+QLabel {
+    color: #ffffff;
+}
+QSlider::groove:horizontal {
+    border: 1px solid #3A3939;
+    height: 8px;
+    background: #201F1F;
+    margin: 0px;
+    border-radius: 2px;
+}
+QSlider::handle:horizontal {
+    background: #3c3f41;
+    border: 1px solid #3A3939;
+    width: 14px;
+    height: 14px;
+    margin: -3px 0;
+    border-radius: 7px;
+}
+"""
+
+SETTINGS_ATTRS = ('image_path', 'display_index', 'global_hotkey', 'opacity',
+                  'gif_speed', 'scaling_mode', 'advanced_settings')
+_settings_getter = operator.attrgetter(*SETTINGS_ATTRS)
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp')
+
+# Order matches the scaling mode combo box entries
+SCALING_MODES = ('fit', 'stretch', 'center', 'tile')
+SCALING_MODE_INDEX = {mode: index for index, mode in enumerate(SCALING_MODES)}
+
+PIXMAP_BUCKET = 64
+PIXMAP_POOL_DEPTH = 2
+# Across all buckets: room for about two 4K buffers, so display switches and resizes don't pin old sizes
+PIXMAP_POOL_MAX_BYTES = 64 * 1024 * 1024
+# Least recently released bucket first
+_PIXMAP_POOL = OrderedDict()
+
+def _pixmap_bucket(size):
+    """Round a size up to the pool bucket grid"""
+    width = -(-max(1, size.width()) // PIXMAP_BUCKET) * PIXMAP_BUCKET
+    height = -(-max(1, size.height()) // PIXMAP_BUCKET) * PIXMAP_BUCKET
+    return width, height
+
+def _pixmap_bytes(pixmap):
+    return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+def acquire_pixmap(size):
+    """Get a pixmap at least as large as size, reusing a pooled one when possible"""
+    bucket = _pixmap_bucket(size)
+    pool = _PIXMAP_POOL.get(bucket)
+    if pool:
+        pixmap = pool.pop()
+        if not pool:
+            del _PIXMAP_POOL[bucket]
+        return pixmap
+    return QtGui.QPixmap(*bucket)
+
+def release_pixmap(pixmap):
+    """Hand a pixmap from acquire_pixmap back to the pool"""
+    if pixmap is None or pixmap.isNull():
+        return
+    bucket = (pixmap.width(), pixmap.height())
+    pool = _PIXMAP_POOL.setdefault(bucket, [])
+    _PIXMAP_POOL.move_to_end(bucket)
+    if len(pool) < PIXMAP_POOL_DEPTH:
+        pool.append(pixmap)
+    total = sum(_pixmap_bytes(pooled) for pooled_list in _PIXMAP_POOL.values() for pooled in pooled_list)
+    while total > PIXMAP_POOL_MAX_BYTES and _PIXMAP_POOL:
+        oldest_bucket, oldest_pool = next(iter(_PIXMAP_POOL.items()))
+        total -= _pixmap_bytes(oldest_pool.pop(0))
+        if not oldest_pool:
+            del _PIXMAP_POOL[oldest_bucket]
+
+if sys.platform.startswith('linux'):
+    try:
+        _libc = ctypes.CDLL("libc.so.6")
+    except OSError:
+        _libc = None
+else:
+    _libc = None
+
+def purge_memory():
+    """Empty the shared pixmap caches and hand freed heap back to the OS; for explicit low-memory paths only"""
+    _PIXMAP_POOL.clear()
+    QtGui.QPixmapCache.clear()
+    gc.collect()
+    if _libc is not None:
+        try:
+            _libc.malloc_trim(0)
+        except AttributeError:
+            pass
+
+def pillow_decode(image_path, final_size, keep_aspect=True, smooth=True, auto_transform=True):
+    """Decode and resize an image with Pillow to a premultiplied QImage
+
+    Returns None when Pillow is unavailable or cannot read the file, so callers
+    can fall back to QImageReader. Safe to call off the GUI thread.
+    """
+    if PILImage is None:
+        return None
+    resample = PILImage.BILINEAR if smooth else PILImage.NEAREST
+    
+    try:
+        with PILImage.open(image_path) as im:
+            if image_path.lower().endswith(('.jpg', '.jpeg')):
+                # Let libjpeg scale by 1/2..1/8 during decode; the square box keeps
+                # enough headroom for either EXIF orientation
+                draft_side = 2 * max(final_size)
+                im.draft('RGB', (draft_side, draft_side))
+                
+            if auto_transform:
+                im = ImageOps.exif_transpose(im)
+                
+            if keep_aspect:
+                ratio = min(final_size[0] / im.width, final_size[1] / im.height)
+                final_size = (max(1, round(im.width * ratio)), max(1, round(im.height * ratio)))
+                
+            im = im.convert('RGBA')
+            if im.size != final_size:
+                im = im.resize(final_size, resample)
+            data = im.tobytes('raw', 'RGBA')
+    except (OSError, ValueError):
+        return None
+        
+    width, height = final_size
+    image = QtGui.QImage(data, width, height, width * 4, QtGui.QImage.Format_RGBA8888)
+    
+    # Converting copies out of the Python-owned buffer
+    return image.convertToFormat(QtGui.QImage.Format_ARGB32_Premultiplied)
+
+
+# Worker-decoded overlay images waiting for OverlayWindow to pick them up; holds at most one
+_PREFETCHED_STILLS = {}
+
+
+def still_decode_key(image_path, mtime_ns, scaling_mode, window_size, scale_factor, tile_scale):
+    return f"{image_path}|{mtime_ns}|{scaling_mode}|{window_size.width()}x{window_size.height()}|{scale_factor}|{tile_scale}"
+
+
+def decode_still_image(image_path, scaling_mode, window_size, scale_factor=1.0, tile_scale=1.0):
+    """Decode a still image at the size its scaling mode displays it; safe to call off the GUI thread"""
+    reader = QtGui.QImageReader(image_path)
+    source_size = reader.size()
+    if scaling_mode in ('fit', 'stretch'):
+        target_size = QtCore.QSize(
+            max(1, int(window_size.width() * scale_factor)),
+            max(1, int(window_size.height() * scale_factor))
+        )
+        if scaling_mode == 'fit' and source_size.isValid():
+            target_size = source_size.scaled(target_size, QtCore.Qt.KeepAspectRatio).expandedTo(QtCore.QSize(1, 1))
+        if scaling_mode == 'stretch' or source_size.isValid():
+            reader.setScaledSize(target_size)
+    elif scaling_mode == 'tile':
+        if tile_scale != 1.0 and source_size.isValid():
+            reader.setScaledSize(QtCore.QSize(
+                max(1, int(source_size.width() * tile_scale)),
+                max(1, int(source_size.height() * tile_scale))
+            ))
+    image = reader.read()
+    if image.isNull():
+        return image
+    if scaling_mode == 'fit' and not source_size.isValid():
+        image = image.scaled(target_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+    # Convert here, possibly on a worker, so blitting onto the translucent overlay never has to
+    if image.format() != QtGui.QImage.Format_ARGB32_Premultiplied:
+        image = image.convertToFormat(QtGui.QImage.Format_ARGB32_Premultiplied)
+    return image
+
+
+class ImageDecodeSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(str, QtGui.QImage)
+
+
+class ImageDecodeTask(QtCore.QRunnable):
+    """Runs CachedImageRenderer.decode_image on a worker thread"""
+    def __init__(self, renderer, cache_key, image_path, target_size, scaling_mode, scale_factor):
+        super().__init__()
+        self.renderer = renderer
+        self.cache_key = cache_key
+        self.args = (image_path, target_size, scaling_mode, scale_factor)
+        self.signals = ImageDecodeSignals()
+
+    def run(self):
+        self.signals.done.emit(self.cache_key, self.renderer.decode_image(*self.args))
+
+
+class StillImagePrefetch(QtCore.QRunnable):
+    """Decodes the overlay's still image ahead of time on a worker thread"""
+    def __init__(self, decode_key, image_path, scaling_mode, window_size, scale_factor, tile_scale):
+        super().__init__()
+        self.decode_key = decode_key
+        self.args = (image_path, scaling_mode, window_size, scale_factor, tile_scale)
+        self.signals = ImageDecodeSignals()
+
+    def run(self):
+        self.signals.done.emit(self.decode_key, decode_still_image(*self.args))
+
+
+class CachedImageRenderer(QtCore.QObject):
     """Handles efficient image loading, caching and scaling"""
-    def __init__(self, advanced_settings=None):
+    image_ready = QtCore.pyqtSignal()
+
+    def __init__(self, advanced_settings=None, parent=None):
+        super().__init__(parent)
+        self.cache_keys = set()
+        self.pending = set()
+        self.path_hashes = {}
+        self.reconfigure(advanced_settings)
+
+    def reconfigure(self, advanced_settings):
+        """Re-read the settings used while decoding"""
         self.advanced_settings = advanced_settings or {}
-        self.cache = {}
-        self.cache_order = []
-        self.max_cache_entries = self.advanced_settings.get('cache_size', 100)
+        self._hwaccel = self.advanced_settings.get('enable_hardware_acceleration', True)
+        self._transform_mode = (QtCore.Qt.SmoothTransformation if self.advanced_settings.get('enable_antialiasing', True)
+                                else QtCore.Qt.FastTransformation)
         
     def clear_cache(self):
         """Clear the image cache"""
-        self.cache.clear()
-        self.cache_order.clear()
+        for cache_key in self.cache_keys:
+            QtGui.QPixmapCache.remove(cache_key)
+        self.cache_keys.clear()
+
+    def content_key(self, image_path):
+        """Identify a file by its contents so renamed copies share cache entries
 
-    def load_image(self, image_path, target_size=None, scaling_mode='fit', scale_factor=1.0):
-        """Load and scale image efficiently"""
-        cache_key = (image_path, target_size, scaling_mode, scale_factor)
+        The digest is kept for the current image's (path, mtime, size) until
+        forget_content_keys(), so repaints only cost a stat.
+        """
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return image_path
+        file_key = (image_path, stat.st_mtime_ns, stat.st_size)
+        digest = self.path_hashes.get(file_key)
+        if digest is not None:
+            return digest
+        try:
+            hasher = hashlib.blake2b(digest_size=16)
+            with open(image_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    hasher.update(block)
+            digest = hasher.hexdigest()
+        except OSError:
+            return image_path
+        # Only the image currently shown is remembered; an edited file gets a new key
+        self.path_hashes = {file_key: digest}
+        return digest
+
+    def forget_content_keys(self):
+        """Re-identify files on next use, e.g. after the overlay switches or reloads its image"""
+        self.path_hashes.clear()
+
+    def load_image(self, image_path, target_size=None, scaling_mode='fit', scale_factor=1.0, asynchronous=False):
+        """Load and scale image efficiently
+
+        With asynchronous=True a cache miss returns None and decodes on the
+        global thread pool; image_ready is emitted once the pixmap is cached.
+        """
+        size_key = f"{target_size.width()}x{target_size.height()}" if target_size else "source"
+        cache_key = f"{self.content_key(image_path)}|{size_key}|{scaling_mode}|{scale_factor}"
         
         
-        if cache_key in self.cache:
-            self.cache_order.remove(cache_key)
-            self.cache_order.append(cache_key)
-            return self.cache[cache_key]
+        pixmap = QtGui.QPixmapCache.find(cache_key)
+        if pixmap is not None:
+            return pixmap
             
         
+        if asynchronous:
+            if cache_key not in self.pending:
+                self.pending.add(cache_key)
+                task = ImageDecodeTask(self, cache_key, image_path, target_size, scaling_mode, scale_factor)
+                task.signals.done.connect(self.on_image_decoded)
+                QtCore.QThreadPool.globalInstance().start(task)
+            return None
+            
+        return self.store_image(cache_key, self.decode_image(image_path, target_size, scaling_mode, scale_factor))
+
+    def decode_image(self, image_path, target_size=None, scaling_mode='fit', scale_factor=1.0):
+        """Decode and scale an image to a QImage; safe to call off the GUI thread"""
+        if PILImage is not None and target_size and scaling_mode in ('fit', 'stretch'):
+            image = self.decode_with_pillow(image_path, target_size, scaling_mode, scale_factor)
+            if image is not None:
+                return image
+                
         image_reader = QtGui.QImageReader(image_path)
-        if target_size:
-            image_reader.setScaledSize(target_size)
         
         
-        if self.advanced_settings.get('enable_hardware_acceleration', True):
+        if self._hwaccel:
             image_reader.setAutoTransform(True)
             
+        
+        final_size = None
+        if target_size and scaling_mode in ('fit', 'stretch'):
+            final_size = QtCore.QSize(
+                max(1, int(target_size.width() * scale_factor)),
+                max(1, int(target_size.height() * scale_factor))
+            )
+            source_size = image_reader.size()
+            if scaling_mode == 'fit' and source_size.isValid():
+                final_size = source_size.scaled(final_size, QtCore.Qt.KeepAspectRatio).expandedTo(QtCore.QSize(1, 1))
+            if scaling_mode == 'stretch' or source_size.isValid():
+                image_reader.setScaledSize(final_size)
+            
         image = image_reader.read()
         if image.isNull():
-            return None
+            return image
             
         
-        if scaling_mode == 'fit':
-            scaled_width = max(1, int(target_size.width() * scale_factor))
-            scaled_height = max(1, int(target_size.height() * scale_factor))
-            image = image.scaled(
-                scaled_width, 
-                scaled_height,
-                QtCore.Qt.KeepAspectRatio,
-                QtCore.Qt.SmoothTransformation if self.advanced_settings.get('enable_antialiasing', True)
-                else QtCore.Qt.FastTransformation
-            )
-        elif scaling_mode == 'stretch':
-            scaled_width = max(1, int(target_size.width() * scale_factor))
-            scaled_height = max(1, int(target_size.height() * scale_factor))
+        if final_size is not None and image.size() != final_size:
             image = image.scaled(
-                scaled_width,
-                scaled_height,
-                QtCore.Qt.IgnoreAspectRatio,
-                QtCore.Qt.SmoothTransformation if self.advanced_settings.get('enable_antialiasing', True)
-                else QtCore.Qt.FastTransformation
+                final_size,
+                QtCore.Qt.KeepAspectRatio if scaling_mode == 'fit' else QtCore.Qt.IgnoreAspectRatio,
+                self._transform_mode
             )
             
         
+        if image.format() != QtGui.QImage.Format_ARGB32_Premultiplied:
+            image = image.convertToFormat(QtGui.QImage.Format_ARGB32_Premultiplied)
+            
+        return image
+
+    def decode_with_pillow(self, image_path, target_size, scaling_mode, scale_factor):
+        """Decode and resize through Pillow; returns None so the Qt decoder can take over"""
+        final_size = (max(1, int(target_size.width() * scale_factor)),
+                      max(1, int(target_size.height() * scale_factor)))
+        return pillow_decode(
+            image_path,
+            final_size,
+            keep_aspect=scaling_mode == 'fit',
+            smooth=self._transform_mode == QtCore.Qt.SmoothTransformation,
+            auto_transform=self._hwaccel
+        )
+
+    def store_image(self, cache_key, image):
+        """Convert a decoded image to a pixmap and cache it"""
+        if image.isNull():
+            return None
+            
         pixmap = QtGui.QPixmap.fromImage(image)
         
         
-        if len(self.cache) >= self.max_cache_entries:
-            oldest_key = self.cache_order.pop(0)
-            del self.cache[oldest_key]
+        cost_kb = pixmap.width() * pixmap.height() * pixmap.depth() // 8 // 1024
+        if QtGui.QPixmapCache.cacheLimit() < cost_kb * 2:
+            QtGui.QPixmapCache.setCacheLimit(cost_kb * 2)
             
         
-        self.cache[cache_key] = pixmap
-        self.cache_order.append(cache_key)
+        QtGui.QPixmapCache.insert(cache_key, pixmap)
+        self.cache_keys.add(cache_key)
         
         return pixmap
+
+    def on_image_decoded(self, cache_key, image):
+        self.pending.discard(cache_key)
+        if self.store_image(cache_key, image) is not None:
+            self.image_ready.emit()
     
+class PixmapView(QtWidgets.QWidget):
+    """Paints a single pixmap centred in the widget; a leaner stand-in for QLabel on the overlay"""
+    def __init__(self, pixmap=None, parent=None):
+        super().__init__(parent)
+        self._pixmap = pixmap if pixmap is not None else QtGui.QPixmap()
+        self._scaled_contents = False
+
+    def pixmap(self):
+        return self._pixmap
+
+    def setPixmap(self, pixmap):
+        self._pixmap = pixmap
+        self.update()
+
+    def hasScaledContents(self):
+        return self._scaled_contents
+
+    def setScaledContents(self, scaled):
+        self._scaled_contents = scaled
+        self.update()
+
+    def paintEvent(self, event):
+        if self._pixmap.isNull():
+            return
+        painter = QtGui.QPainter(self)
+        if self._scaled_contents:
+            painter.drawPixmap(self.rect(), self._pixmap)
+        else:
+            target = QtCore.QRect(QtCore.QPoint(0, 0), self._pixmap.size())
+            target.moveCenter(self.rect().center())
+            painter.drawPixmap(target.topLeft(), self._pixmap)
+        painter.end()
+
+
 class TiledImageWidget(QtWidgets.QWidget):
     """Efficient widget for displaying tiled images"""
     def __init__(self, image_path, parent=None, advanced_settings=None):
         super().__init__(parent)
         self.image_path = image_path
-        self.advanced_settings = advanced_settings or {}
-        self.renderer = CachedImageRenderer(advanced_settings)
+        self.renderer = CachedImageRenderer(advanced_settings, self)
+        self.renderer.image_ready.connect(self.update)
         
         
         self.tile_cache = {}
-        self.tile_positions = []
-        self.last_size = None
-        self.last_tile_size = None
         
         
         self.setAttribute(QtCore.Qt.WA_PaintOnScreen, False)
@@ -119,91 +555,84 @@ class TiledImageWidget(QtWidgets.QWidget):
         
         self.background_buffer = None
         self.buffer_size = None
-        
-    def calculate_tile_positions(self, tile_size):
-        """Pre-calculate tile positions"""
-        if (self.size() == self.last_size and 
-            tile_size == self.last_tile_size):
-            return
-            
-        self.tile_positions.clear()
-        for x in range(0, self.width(), tile_size.width()):
-            for y in range(0, self.height(), tile_size.height()):
-                self.tile_positions.append(QtCore.QPoint(x, y))
-                
-        self.last_size = self.size()
-        self.last_tile_size = tile_size
+        self._buffer_signature = None
+        self._source_size = QtGui.QImageReader(image_path).size()
+        self.reconfigure(advanced_settings)
+
+    def reconfigure(self, advanced_settings):
+        """Re-read the settings used while painting"""
+        self.advanced_settings = advanced_settings or {}
+        self._tile_scale = max(0.01, self.advanced_settings.get('tile_scale', 1.0))
+        self.renderer.reconfigure(self.advanced_settings)
+        self._buffer_signature = None
+        self.update()
         
     def update_background_buffer(self, base_pixmap):
         """Update the background buffer for faster rendering"""
         current_size = self.size()
         if (self.background_buffer is None or 
-            self.buffer_size != current_size):
-            self.background_buffer = QtGui.QPixmap(current_size)
-            self.buffer_size = current_size
+            self.buffer_size != _pixmap_bucket(current_size)):
+            release_pixmap(self.background_buffer)
+            self.background_buffer = acquire_pixmap(current_size)
+            self.buffer_size = _pixmap_bucket(current_size)
             
         self.background_buffer.fill(QtCore.Qt.transparent)
         painter = QtGui.QPainter(self.background_buffer)
-        
-        if self.advanced_settings.get('enable_hardware_acceleration', True):
-            painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
-            
-        for pos in self.tile_positions:
-            painter.drawPixmap(pos, base_pixmap)
-            
+        painter.drawTiledPixmap(self.background_buffer.rect(), base_pixmap)
         painter.end()
         
     def paintEvent(self, event):
+        if event.region().isEmpty() or not self.isVisible():
+            return
         
-        tile_scale = max(0.01, self.advanced_settings.get('tile_scale', 1.0))
-        base_size = QtCore.QSize(
-            int(self.width() * tile_scale),
-            int(self.height() * tile_scale)
-        )
+        # Scale the source to one tile once; the buffer repeats that tile
+        tile_size = None
+        if self._source_size.isValid() and self._tile_scale != 1.0:
+            tile_size = QtCore.QSize(
+                max(1, int(self._source_size.width() * self._tile_scale)),
+                max(1, int(self._source_size.height() * self._tile_scale))
+            )
         
         base_pixmap = self.renderer.load_image(
             self.image_path,
-            base_size,
-            'fit',
-            tile_scale
+            tile_size,
+            'stretch',
+            1.0,
+            asynchronous=self.background_buffer is not None
         )
         
         if base_pixmap is None:
+            if self.background_buffer is not None:
+                painter = QtGui.QPainter(self)
+                painter.drawPixmap(0, 0, self.background_buffer)
+                painter.end()
             return
             
         
-        self.calculate_tile_positions(base_pixmap.size())
-        
-        
-        self.update_background_buffer(base_pixmap)
+        signature = (base_pixmap.cacheKey(), self.size())
+        if signature != self._buffer_signature:
+            self.update_background_buffer(base_pixmap)
+            self._buffer_signature = signature
         
         
         painter = QtGui.QPainter(self)
         painter.drawPixmap(0, 0, self.background_buffer)
         painter.end()
-        
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # Dropped rather than pooled: the point is not to keep a full-screen pixmap alive while hidden
         self.background_buffer = None
         self.buffer_size = None
+        self._buffer_signature = None
 
 
 class TiledGIFWidget(QtWidgets.QWidget):
     def __init__(self, movie, parent=None, advanced_settings=None):
         super().__init__(parent)
         self.movie = movie
-        self.advanced_settings = advanced_settings or {}
-        
-        
-        self.max_cache_size = self.advanced_settings.get('cache_size', 100)
-        self.scaled_frame_cache = {}
-        self.frame_cache_order = []
-        
-        
-        self.tile_positions = []
-        self.last_size = None
-        self.last_frame_size = None
+        self.scaled_frame_cache = OrderedDict()
+        self.reconfigure(advanced_settings)
         
         
         self.setAttribute(QtCore.Qt.WA_PaintOnScreen, False)
@@ -217,29 +646,30 @@ class TiledGIFWidget(QtWidgets.QWidget):
         
         
         self.background_buffer = None
+        self._last_frame = -1
         
         
-        self.movie.setCacheMode(QtGui.QMovie.CacheAll)
         self.movie.start()
 
+    def reconfigure(self, advanced_settings):
+        """Re-read the settings used while painting"""
+        self.advanced_settings = advanced_settings or {}
+        self.max_cache_size = max(1, self.advanced_settings.get('gif_frame_buffer', 50))
+        self._tile_scale = max(0.01, self.advanced_settings.get('tile_scale', 1.0))
+        self._transform_mode = (QtCore.Qt.SmoothTransformation if self.advanced_settings.get('enable_antialiasing', True)
+                                else QtCore.Qt.FastTransformation)
+        self.scaled_frame_cache.clear()
+        self.update()
+
     def update_frame(self):
         if not self.isVisible():
             return
-        self.repaint()
-
-    def calculate_tile_positions(self, frame_size):
-        """Pre-calculate tile positions for current widget size"""
-        if (self.size() == self.last_size and 
-            frame_size == self.last_frame_size):
+        frame_number = self.movie.currentFrameNumber()
+        if frame_number == self._last_frame:
             return
-            
-        self.tile_positions.clear()
-        for x in range(0, self.width(), frame_size.width()):
-            for y in range(0, self.height(), frame_size.height()):
-                self.tile_positions.append(QtCore.QPoint(x, y))
-                
-        self.last_size = self.size()
-        self.last_frame_size = frame_size
+        self._last_frame = frame_number
+        self.frame_timer.setInterval(max(self.movie.nextFrameDelay(), 20))
+        self.update()
 
     def get_scaled_frame(self, frame, frame_number, tile_scale):
         """Get scaled frame from cache or create new one"""
@@ -248,8 +678,7 @@ class TiledGIFWidget(QtWidgets.QWidget):
         
         if cache_key in self.scaled_frame_cache:
             
-            self.frame_cache_order.remove(cache_key)
-            self.frame_cache_order.append(cache_key)
+            self.scaled_frame_cache.move_to_end(cache_key)
             return self.scaled_frame_cache[cache_key]
             
         
@@ -257,18 +686,15 @@ class TiledGIFWidget(QtWidgets.QWidget):
             max(1, int(frame.width() * tile_scale)),
             max(1, int(frame.height() * tile_scale)),
             QtCore.Qt.KeepAspectRatio,
-            QtCore.Qt.SmoothTransformation if self.advanced_settings.get('enable_antialiasing', True)
-            else QtCore.Qt.FastTransformation
+            self._transform_mode
         )
         
         
         if len(self.scaled_frame_cache) >= self.max_cache_size:
-            oldest_key = self.frame_cache_order.pop(0)
-            del self.scaled_frame_cache[oldest_key]
+            self.scaled_frame_cache.popitem(last=False)
             
         
         self.scaled_frame_cache[cache_key] = scaled_frame
-        self.frame_cache_order.append(cache_key)
         
         return scaled_frame
 
@@ -277,27 +703,15 @@ class TiledGIFWidget(QtWidgets.QWidget):
         if current_frame.isNull():
             return
             
-        painter = QtGui.QPainter(self)
-        
-        
-        if self.advanced_settings.get('enable_hardware_acceleration', True):
-            painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
-            
-        
-        tile_scale = max(0.01, self.advanced_settings.get('tile_scale', 1.0))
         scaled_frame = self.get_scaled_frame(
             current_frame,
             self.movie.currentFrameNumber(),
-            tile_scale
+            self._tile_scale
         )
         
         
-        self.calculate_tile_positions(scaled_frame.size())
-        
-        
-        for pos in self.tile_positions:
-            painter.drawPixmap(pos, scaled_frame)
-            
+        painter = QtGui.QPainter(self)
+        painter.drawTiledPixmap(self.rect(), scaled_frame)
         painter.end()
 
     def showEvent(self, event):
@@ -317,7 +731,6 @@ class TiledGIFWidget(QtWidgets.QWidget):
             self.movie.stop()
             del self.movie
         self.scaled_frame_cache.clear()
-        self.frame_cache_order.clear()
 
 class OverlayWindow(QtWidgets.QWidget):
     def __init__(self, image_path, screen_geometry, opacity=1.0, gif_speed=100, scaling_mode='fit', advanced_settings=None):
@@ -327,14 +740,39 @@ class OverlayWindow(QtWidgets.QWidget):
         self.opacity = opacity
         self.gif_speed = gif_speed
         self.scaling_mode = scaling_mode
+        self._is_tile = scaling_mode == 'tile'
         self.advanced_settings = advanced_settings or {}
         self.edit_mode = False
         self.dragging = False
         self.resizing = False
         self.last_mouse_pos = None
-        self.scale_factor = self.advanced_settings.get('scale_factor', 1.0)  
+        self._clamp_enabled = bool(self.advanced_settings.get('enable_scale_limits', True))
+        self._scaled_cache = {}
+        self._reinit_timer = QtCore.QTimer(self)
+        self._reinit_timer.setSingleShot(True)
+        self._reinit_timer.setInterval(50)
+        self._reinit_timer.timeout.connect(self.initImage)
         self.initUI()
 
+    @property
+    def image_path(self):
+        return self._image_path
+
+    @image_path.setter
+    def image_path(self, value):
+        # Decided once per image instead of lowercasing the path on every re-render
+        self._image_path = value
+        self.is_gif = value.lower().endswith('.gif')
+
+    @property
+    def scale_factor(self):
+        # Lives in the advanced settings dict shared with AnyOverlay so both sides stay in sync
+        return self.advanced_settings.get('scale_factor', 1.0)
+
+    @scale_factor.setter
+    def scale_factor(self, value):
+        self.advanced_settings['scale_factor'] = value
+
     def initUI(self):
         self.setGeometry(self.screen_geometry)
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
@@ -342,41 +780,19 @@ class OverlayWindow(QtWidgets.QWidget):
         self.setMouseTracking(True)
 
         if sys.platform == "win32":
-            hwnd = self.winId().__int__()
-            exStyle = GetWindowLong(hwnd, GWL_EXSTYLE)
-            exStyle |= WS_EX_LAYERED | WS_EX_TRANSPARENT | WS_EX_TOOLWINDOW
-            SetWindowLong(hwnd, GWL_EXSTYLE, exStyle)
+            update_ex_style(int(self.winId()), add=WS_EX_LAYERED | WS_EX_TRANSPARENT | WS_EX_TOOLWINDOW)
         else:
             self.setWindowFlag(QtCore.Qt.WindowTransparentForInput, True)
 
         self.setWindowOpacity(self.opacity)
         self.initImage()
 
-        if not self.layout():
-            layout = QtWidgets.QVBoxLayout()
-            layout.setContentsMargins(0, 0, 0, 0)
-            self.setLayout(layout)
-        else:
-            while self.layout().count():
-                child = self.layout().takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-        self.layout().addWidget(self.label)
-
-        bg_color = self.advanced_settings.get('background_color', '#000000')
-        transparency = self.advanced_settings.get('transparency', 0)
-        color = QtGui.QColor(bg_color)
-        color.setAlpha(transparency)
-        palette = self.palette()
-        palette.setColor(QtGui.QPalette.Window, color)
-        self.setPalette(palette)
-        self.setAutoFillBackground(True)
+        self.setBackground(
+            self.advanced_settings.get('background_color', '#000000'),
+            self.advanced_settings.get('transparency', 0)
+        )
 
-        update_interval = self.advanced_settings.get('update_interval', 0)
-        if update_interval > 0:
-            self.update_timer = QtCore.QTimer(self)
-            self.update_timer.timeout.connect(self.update)
-            self.update_timer.start(update_interval)
+        self.setUpdateInterval(self.advanced_settings.get('update_interval', 0))
 
     def resource_path(self, relative_path):
         try:
@@ -386,7 +802,18 @@ class OverlayWindow(QtWidgets.QWidget):
 
         return os.path.join(base_path, relative_path)
 
+    def release_image_resources(self):
+        """Drop the pixmaps held by the current label before it is replaced"""
+        label = getattr(self, 'label', None)
+        if isinstance(label, TiledImageWidget):
+            label.renderer.clear_cache()
+            release_pixmap(label.background_buffer)
+            label.background_buffer = None
+        elif isinstance(label, TiledGIFWidget):
+            label.scaled_frame_cache.clear()
+
     def initImage(self):
+        self.release_image_resources()
         if hasattr(self, 'label'):
             self.label.setParent(None)
             del self.label
@@ -396,85 +823,104 @@ class OverlayWindow(QtWidgets.QWidget):
 
         QtGui.QPixmapCache.setCacheLimit(self.advanced_settings.get('cache_size', 100) * 1024)
 
-        if self.image_path.lower().endswith('.gif'):
-            self.movie = QtGui.QMovie(self.image_path)
-            self.movie.setSpeed(self.gif_speed)
-            self.movie.setCacheMode(QtGui.QMovie.CacheAll)
-
-            if self.scaling_mode in ['fit', 'stretch']:
-                aspect_mode = QtCore.Qt.KeepAspectRatio if self.scaling_mode == 'fit' else QtCore.Qt.IgnoreAspectRatio
-
-                original_size = self.size()
-                scaled_width = max(1, int(original_size.width() * self.scale_factor))
-                scaled_height = max(1, int(original_size.height() * self.scale_factor))
-                scaled_size = QtCore.QSize(scaled_width, scaled_height)
-                self.movie.setScaledSize(scaled_size)
-                self.label = QtWidgets.QLabel(self)
-                self.label.setAlignment(QtCore.Qt.AlignCenter)
-                self.label.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
-                self.label.setMovie(self.movie)
-                self.movie.start()
-            elif self.scaling_mode == 'center':
-                self.movie.setScaledSize(QtCore.QSize())
-                self.label = QtWidgets.QLabel(self)
-                self.label.setAlignment(QtCore.Qt.AlignCenter)
-                self.label.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
-                self.label.setMovie(self.movie)
-                self.movie.start()
-            elif self.scaling_mode == 'tile':
-                self.label = TiledGIFWidget(self.movie, self, self.advanced_settings)
+        if self.is_gif:
+            self.initGifImage()
         else:
-            pixmap = QtGui.QPixmap(self.image_path)
-            if pixmap.isNull():
+            scaled_pixmap = self.renderStillPixmap()
+            if scaled_pixmap is None:
                 QtWidgets.QMessageBox.warning(self, "Error", "Failed to load image.")
                 return
 
-            if self.scaling_mode == 'fit':
-                scaled_width = max(1, int(self.size().width() * self.scale_factor))
-                scaled_height = max(1, int(self.size().height() * self.scale_factor))
-                scaled_pixmap = pixmap.scaled(
-                    QtCore.QSize(scaled_width, scaled_height),
-                    QtCore.Qt.KeepAspectRatio,
-                    QtCore.Qt.SmoothTransformation
-                )
-            elif self.scaling_mode == 'stretch':
-                scaled_width = max(1, int(self.size().width() * self.scale_factor))
-                scaled_height = max(1, int(self.size().height() * self.scale_factor))
-                scaled_pixmap = pixmap.scaled(
-                    QtCore.QSize(scaled_width, scaled_height),
-                    QtCore.Qt.IgnoreAspectRatio,
-                    QtCore.Qt.SmoothTransformation
-                )
-            elif self.scaling_mode == 'center':
-                scaled_pixmap = pixmap
-            elif self.scaling_mode == 'tile':
-                tile_size = pixmap.size()
-                tile_scale = self.advanced_settings.get('tile_scale', 1.0)
-                if tile_scale != 1.0:
-                    tile_width = max(1, int(tile_size.width() * tile_scale))
-                    tile_height = max(1, int(tile_size.height() * tile_scale))
-                    tile_size = QtCore.QSize(tile_width, tile_height)
-                    pixmap = pixmap.scaled(tile_size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-                window_size = self.size()
-                tiled_pixmap = QtGui.QPixmap(window_size)
-                tiled_pixmap.fill(QtCore.Qt.transparent)  
-
-                painter = QtGui.QPainter(tiled_pixmap)
-                painter.setRenderHint(QtGui.QPainter.Antialiasing, self.advanced_settings.get('enable_antialiasing', True))
-                for x in range(0, window_size.width(), pixmap.width()):
-                    for y in range(0, window_size.height(), pixmap.height()):
-                        painter.drawPixmap(x, y, pixmap)
-                painter.end()
-                scaled_pixmap = tiled_pixmap
+            self.label = PixmapView(scaled_pixmap, self)
+
+        if isinstance(self.label, QtWidgets.QLabel):
+            self.label.setScaledContents(False)
 
+        self.attachLabel()
+
+    def renderStillPixmap(self):
+        """Decode and scale the still image for the current mode; None if it can't be read"""
+        try:
+            stat = os.stat(self.image_path)
+        except OSError:
+            return None
+        tile_scale = self.advanced_settings.get('tile_scale', 1.0)
+        cache_key = (self.image_path, stat.st_mtime_ns, self.width(), self.height(), self.scaling_mode,
+                     self.scale_factor, tile_scale, self.advanced_settings.get('enable_antialiasing', True))
+        cached = self._scaled_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        decode_key = still_decode_key(self.image_path, stat.st_mtime_ns, self.scaling_mode, self.size(),
+                                      self.scale_factor, tile_scale)
+        image = _PREFETCHED_STILLS.pop(decode_key, None)
+        if image is None:
+            image = decode_still_image(self.image_path, self.scaling_mode, self.size(), self.scale_factor, tile_scale)
+        if image.isNull():
+            return None
+        pixmap = QtGui.QPixmap.fromImage(image)
+
+        if self.scaling_mode in ('fit', 'stretch', 'center'):
+            scaled_pixmap = pixmap
+        elif self.scaling_mode == 'tile':
+            window_size = self.size()
+            tiled_pixmap = QtGui.QPixmap(window_size)
+            tiled_pixmap.fill(QtCore.Qt.transparent)
+
+            painter = QtGui.QPainter(tiled_pixmap)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing, self.advanced_settings.get('enable_antialiasing', True))
+            painter.drawTiledPixmap(tiled_pixmap.rect(), pixmap)
+            painter.end()
+            scaled_pixmap = tiled_pixmap
+        # Only serves an identical re-render (a scale tick back to the same value, or re-init with unchanged
+        # inputs); a mode or image round trip misses. Kept to one entry so window-sized pixmaps don't pile up
+        self._scaled_cache = {cache_key: scaled_pixmap}
+        return scaled_pixmap
+
+    def attachLabel(self):
+        # The label is the only child and always fills the window, so it is sized directly
+        # rather than through a layout; resizeEvent keeps it in step
+        self.label.setGeometry(self.rect())
+        self.label.show()
+
+    def gifCacheMode(self):
+        """Only let QMovie keep every decoded frame when the whole animation fits the memory budget"""
+        reader = QtGui.QImageReader(self.image_path)
+        frame_size = reader.size()
+        if not frame_size.isValid():
+            return QtGui.QMovie.CacheNone
+        decoded_bytes = frame_size.width() * frame_size.height() * 4 * max(1, reader.imageCount())
+        if decoded_bytes > self.advanced_settings.get('max_memory_usage', 512) * 1024 * 1024:
+            return QtGui.QMovie.CacheNone
+        return QtGui.QMovie.CacheAll
+
+    def initGifImage(self):
+        self.movie = QtGui.QMovie(self.image_path)
+        self.movie.setSpeed(self.gif_speed)
+        self.movie.setCacheMode(self.gifCacheMode())
+
+        if self.scaling_mode in ['fit', 'stretch']:
+            aspect_mode = QtCore.Qt.KeepAspectRatio if self.scaling_mode == 'fit' else QtCore.Qt.IgnoreAspectRatio
+
+            original_size = self.size()
+            scaled_width = max(1, int(original_size.width() * self.scale_factor))
+            scaled_height = max(1, int(original_size.height() * self.scale_factor))
+            scaled_size = QtCore.QSize(scaled_width, scaled_height)
+            self.movie.setScaledSize(scaled_size)
             self.label = QtWidgets.QLabel(self)
-            self.label.setPixmap(scaled_pixmap)
             self.label.setAlignment(QtCore.Qt.AlignCenter)
             self.label.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
-
-        if isinstance(self.label, QtWidgets.QLabel):
-            self.label.setScaledContents(False)
-            self.label.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+            self.label.setMovie(self.movie)
+            self.movie.start()
+        elif self.scaling_mode == 'center':
+            self.movie.setScaledSize(QtCore.QSize())
+            self.label = QtWidgets.QLabel(self)
+            self.label.setAlignment(QtCore.Qt.AlignCenter)
+            self.label.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
+            self.label.setMovie(self.movie)
+            self.movie.start()
+        elif self.scaling_mode == 'tile':
+            self.label = TiledGIFWidget(self.movie, self, self.advanced_settings)
 
     def setImage(self, image_path):
         if self.image_path == image_path:
@@ -486,6 +932,26 @@ class OverlayWindow(QtWidgets.QWidget):
         self.opacity = opacity
         self.setWindowOpacity(self.opacity)
 
+    def setBackground(self, bg_color, transparency):
+        color = QtGui.QColor(bg_color)
+        color.setAlpha(transparency)
+        palette = self.palette()
+        palette.setColor(QtGui.QPalette.Window, color)
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
+
+    def setUpdateInterval(self, interval):
+        if interval > 0:
+            if hasattr(self, 'update_timer'):
+                self.update_timer.setInterval(interval)
+            else:
+                self.update_timer = QtCore.QTimer(self)
+                self.update_timer.timeout.connect(self.update)
+                self.update_timer.start(interval)
+        elif hasattr(self, 'update_timer'):
+            self.update_timer.stop()
+            del self.update_timer
+
     def setGifSpeed(self, speed):
         self.gif_speed = speed
         if hasattr(self, 'movie'):
@@ -495,27 +961,40 @@ class OverlayWindow(QtWidgets.QWidget):
         if self.scaling_mode == mode:
             return
         self.scaling_mode = mode
+        self._is_tile = mode == 'tile'
         self.initImage()
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if hasattr(self, 'label'):
+            self.label.setGeometry(self.rect())
+        # The cached render is sized to the old window and can't be hit again
+        self._scaled_cache.clear()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if hasattr(self, 'movie'):
+            self.movie.setPaused(False)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # A hidden overlay is kept for reuse; don't keep decoding frames nobody sees
+        if hasattr(self, 'movie'):
+            self.movie.setPaused(True)
+
     def set_edit_mode(self, edit_mode):
         self.edit_mode = edit_mode
         if self.edit_mode:
             self.setCursor(QtCore.Qt.SizeAllCursor)
             if sys.platform == "win32":
-                hwnd = self.winId().__int__()
-                exStyle = GetWindowLong(hwnd, GWL_EXSTYLE)
-                exStyle &= ~WS_EX_TRANSPARENT
-                SetWindowLong(hwnd, GWL_EXSTYLE, exStyle)
+                update_ex_style(int(self.winId()), remove=WS_EX_TRANSPARENT)
             else:
                 self.setWindowFlag(QtCore.Qt.WindowTransparentForInput, False)
             self.activateWindow()
         else:
             self.setCursor(QtCore.Qt.ArrowCursor)
             if sys.platform == "win32":
-                hwnd = self.winId().__int__()
-                exStyle = GetWindowLong(hwnd, GWL_EXSTYLE)
-                exStyle |= WS_EX_TRANSPARENT
-                SetWindowLong(hwnd, GWL_EXSTYLE, exStyle)
+                update_ex_style(int(self.winId()), add=WS_EX_TRANSPARENT)
             else:
                 self.setWindowFlag(QtCore.Qt.WindowTransparentForInput, True)
 
@@ -545,67 +1024,97 @@ class OverlayWindow(QtWidgets.QWidget):
                 delta = event.globalPos() - self.last_mouse_pos
                 new_width = max(self.width() + delta.x(), 50)
                 new_height = max(self.height() + delta.y(), 50)
+                if isinstance(getattr(self, 'label', None), (QtWidgets.QLabel, PixmapView)):
+                    self.label.setScaledContents(True)
                 self.resize(new_width, new_height)
                 self.last_mouse_pos = event.globalPos()
-                self.initImage()
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event):
         if self.edit_mode:
             self.dragging = False
-            self.resizing = False
+            if self.resizing:
+                self.resizing = False
+                self.initImage()
+
+    def _adjust_scale(self, delta):
+        """Step the active scale setting by delta and schedule a rebuild"""
+        adv = self.advanced_settings
+        key = 'tile_scale' if self._is_tile else 'scale_factor'
+        current_scale = adv.get(key, 1.0)
+        new_scale = current_scale + delta
+        if self._clamp_enabled:
+            if new_scale > 10.0:
+                new_scale = 10.0
+            elif new_scale < 0.1:
+                new_scale = 0.1
+        if new_scale == current_scale:
+            return
+        adv[key] = new_scale
+
+        self.save_settings()
+        self._reinit_timer.start()
 
     def increase_scale(self):
         """
         Increases the scale factor of the overlay image.
         """
-        if self.scaling_mode == 'tile':
-            current_scale = self.advanced_settings.get('tile_scale', 1.0)
-            new_scale = current_scale + 0.1
-            if self.advanced_settings.get('enable_scale_limits', True):
-                new_scale = min(new_scale, 10.0)  
-            self.advanced_settings['tile_scale'] = new_scale
-        else:
-            new_scale = self.advanced_settings.get('scale_factor', 1.0) + 0.1
-            if self.advanced_settings.get('enable_scale_limits', True):
-                new_scale = min(new_scale, 10.0)  
-            self.advanced_settings['scale_factor'] = new_scale
-
-        self.save_settings()
-        if self.scaling_mode == 'tile':
-            self.advanced_settings['tile_scale'] = self.advanced_settings['tile_scale']
-        self.initImage()
+        self._adjust_scale(0.1)
 
     def decrease_scale(self):
         """
         Decreases the scale factor of the overlay image.
         """
-        if self.scaling_mode == 'tile':
-            current_scale = self.advanced_settings.get('tile_scale', 1.0)
-            new_scale = current_scale - 0.1
-            if self.advanced_settings.get('enable_scale_limits', True):
-                new_scale = max(new_scale, 0.1)  
-            self.advanced_settings['tile_scale'] = new_scale
-        else:
-            new_scale = self.advanced_settings.get('scale_factor', 1.0) - 0.1
-            if self.advanced_settings.get('enable_scale_limits', True):
-                new_scale = max(new_scale, 0.1)  
-            self.advanced_settings['scale_factor'] = new_scale
-
-        self.save_settings()
-        if self.scaling_mode == 'tile':
-            self.advanced_settings['tile_scale'] = self.advanced_settings['tile_scale']
-        self.initImage()
+        self._adjust_scale(-0.1)
 
     def save_settings(self):
         
         pass
 
 
+class ThumbLoaderSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(str, QtGui.QImage)
+
+
+class ThumbLoader(QtCore.QRunnable):
+    """Decodes a gallery thumbnail on a worker thread"""
+    def __init__(self, image_path, thumb_path, size):
+        super().__init__()
+        self.image_path = image_path
+        self.thumb_path = thumb_path
+        self.size = size
+        self.signals = ThumbLoaderSignals()
+
+    def run(self):
+        image = QtGui.QImage(self.thumb_path) if os.path.exists(self.thumb_path) else QtGui.QImage()
+        if image.isNull():
+            image = pillow_decode(self.image_path, (self.size.width(), self.size.height()))
+            if image is None:
+                image = self.decode_with_qt()
+            if not image.isNull():
+                image.save(self.thumb_path, "PNG")
+        self.signals.done.emit(self.image_path, image)
+
+    def decode_with_qt(self):
+        reader = QtGui.QImageReader(self.image_path)
+        # Below 50 the JPEG plugin takes its fast scaled-decode path; invisible at thumbnail size
+        reader.setQuality(25)
+        source_size = reader.size()
+        if source_size.isValid():
+            reader.setScaledSize(source_size.scaled(self.size, QtCore.Qt.KeepAspectRatio).expandedTo(QtCore.QSize(1, 1)))
+        image = reader.read()
+        if not image.isNull() and not source_size.isValid():
+            image = image.scaled(self.size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation)
+        return image
+
+
 class MediaGallery(QtWidgets.QDialog):
+    max_cols = 3
+
     def __init__(self, overlays_dir, parent=None):
         super().__init__(parent)
         self.overlays_dir = overlays_dir
+        self.thumb_cache_dir = os.path.join(overlays_dir, '.thumb_cache')
         self.selected_image_path = None
         self.selected_button = None
         self.initUI()
@@ -649,13 +1158,14 @@ class MediaGallery(QtWidgets.QDialog):
             os.makedirs(self.overlays_dir)
 
         self.image_buttons = []
-        row = 0
-        col = 0
-        max_cols = 3
+        self.thumbnail_buttons = {}
 
-        image_files = [f for f in os.listdir(self.overlays_dir)
-                       if os.path.isfile(os.path.join(self.overlays_dir, f)) and
-                       f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp'))]
+        os.makedirs(self.thumb_cache_dir, exist_ok=True)
+
+        # DirEntry.is_file() reuses the type from readdir instead of a stat per file
+        with os.scandir(self.overlays_dir) as entries:
+            image_files = [entry.name for entry in entries
+                           if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS)]
 
         add_widget = QtWidgets.QWidget()
         add_layout = QtWidgets.QVBoxLayout()
@@ -690,53 +1200,82 @@ class MediaGallery(QtWidgets.QDialog):
         add_label.setAlignment(QtCore.Qt.AlignCenter)
         add_layout.addWidget(add_label)
 
-        self.grid_layout.addWidget(add_widget, row, col)
-        col += 1
-        if col >= max_cols:
-            col = 0
-            row += 1
+        self.grid_layout.addWidget(add_widget, 0, 0)
 
+        self.grid_widget.setUpdatesEnabled(False)
+        self.grid_layout.setEnabled(False)
+        live_thumbs = set()
         for image_file in image_files:
-            image_path = os.path.join(self.overlays_dir, image_file)
-
-            tile_widget = QtWidgets.QWidget()
-            tile_layout = QtWidgets.QVBoxLayout()
-            tile_layout.setContentsMargins(0, 0, 0, 0)
-            tile_layout.setSpacing(0)
-            tile_widget.setLayout(tile_layout)
-
-            button = QtWidgets.QPushButton()
-            button.setMinimumSize(160, 90)
-            button.setMaximumSize(160, 90)
-            button.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-
-            reader = QtGui.QImageReader(image_path)
-            reader.setScaledSize(QtCore.QSize(160, 90))
-            image = reader.read()
-            if image.isNull():
-                continue
-            pixmap = QtGui.QPixmap.fromImage(image)
-            pixmap = pixmap.scaled(160, 90, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-            icon = QtGui.QIcon(pixmap)
-            button.setIcon(icon)
-            button.setIconSize(QtCore.QSize(160, 90))
-            button.setToolTip(image_file)
-            button.clicked.connect(lambda checked, path=image_path, btn=button: self.select_image(path, btn))
-            tile_layout.addWidget(button, alignment=QtCore.Qt.AlignCenter)
-            self.image_buttons.append(button)
-
-            label = QtWidgets.QLabel(image_file)
-            label.setAlignment(QtCore.Qt.AlignCenter)
-            tile_layout.addWidget(label)
-
-            button.tile_widget = tile_widget
-
-            self.grid_layout.addWidget(tile_widget, row, col)
-
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+            live_thumbs.add(self.add_image_tile(os.path.join(self.overlays_dir, image_file)))
+        self.grid_layout.setEnabled(True)
+        self.grid_widget.setUpdatesEnabled(True)
+        self.prune_thumb_cache(live_thumbs)
+
+    def add_image_tile(self, image_path):
+        """Append one gallery tile and queue its thumbnail; returns the thumbnail's cache file name"""
+        image_file = os.path.basename(image_path)
+        # Index the current item count so the new tile lands right after the last one
+        position = divmod(self.grid_layout.count(), self.max_cols)
+
+        tile_widget = QtWidgets.QWidget()
+        tile_layout = QtWidgets.QVBoxLayout()
+        tile_layout.setContentsMargins(0, 0, 0, 0)
+        tile_layout.setSpacing(0)
+        tile_widget.setLayout(tile_layout)
+
+        button = QtWidgets.QPushButton()
+        button.setMinimumSize(160, 90)
+        button.setMaximumSize(160, 90)
+        button.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+
+        thumb_path = self.thumb_path(image_path)
+        # The cache file name already encodes mtime and size, so it doubles as the QPixmapCache key
+        button.thumb_key = 'thumb:' + os.path.basename(thumb_path)
+        self.thumbnail_buttons[image_path] = button
+        cached_thumb = QtGui.QPixmapCache.find(button.thumb_key)
+        if cached_thumb is not None:
+            button.setIcon(QtGui.QIcon(cached_thumb))
+        else:
+            loader = ThumbLoader(image_path, thumb_path, QtCore.QSize(160, 90))
+            loader.signals.done.connect(self.on_thumbnail_loaded)
+            QtCore.QThreadPool.globalInstance().start(loader)
+        button.setIconSize(QtCore.QSize(160, 90))
+        button.setToolTip(image_file)
+        button.clicked.connect(lambda checked, path=image_path, btn=button: self.select_image(path, btn))
+        tile_layout.addWidget(button, alignment=QtCore.Qt.AlignCenter)
+        self.image_buttons.append(button)
+
+        label = QtWidgets.QLabel(image_file)
+        label.setAlignment(QtCore.Qt.AlignCenter)
+        tile_layout.addWidget(label)
+
+        button.tile_widget = tile_widget
+
+        self.grid_layout.addWidget(tile_widget, *position)
+        return os.path.basename(thumb_path)
+
+    def thumb_path(self, image_path):
+        """Disk cache location for a thumbnail; changes whenever the source file does"""
+        stat = os.stat(image_path)
+        key = hashlib.blake2b(f"{image_path}|{stat.st_mtime_ns}|{stat.st_size}".encode(), digest_size=12).hexdigest()
+        return os.path.join(self.thumb_cache_dir, key + '.png')
+
+    def prune_thumb_cache(self, live_thumbs):
+        """Delete cached thumbnails whose source image was removed or modified"""
+        for thumb_file in os.listdir(self.thumb_cache_dir):
+            if thumb_file not in live_thumbs:
+                try:
+                    os.remove(os.path.join(self.thumb_cache_dir, thumb_file))
+                except OSError:
+                    pass
+
+    def on_thumbnail_loaded(self, image_path, image):
+        button = self.thumbnail_buttons.get(image_path)
+        if button is None or image.isNull():
+            return
+        pixmap = QtGui.QPixmap.fromImage(image)
+        QtGui.QPixmapCache.insert(button.thumb_key, pixmap)
+        button.setIcon(QtGui.QIcon(pixmap))
 
     def add_new_image(self):
         options = QtWidgets.QFileDialog.Options()
@@ -757,12 +1296,14 @@ class MediaGallery(QtWidgets.QDialog):
 
             ext = os.path.splitext(original_file_name)[1]
             base_name = name + ext
-            dest_path = os.path.join(self.overlays_dir, base_name)
+            # Compared case-insensitively so a name that collides on Windows is never reused
+            existing_names = {entry.lower() for entry in os.listdir(self.overlays_dir)}
 
             i = 1
-            while os.path.exists(dest_path):
-                dest_path = os.path.join(self.overlays_dir, f"{name}_{i}{ext}")
+            while base_name.lower() in existing_names:
+                base_name = f"{name}_{i}{ext}"
                 i += 1
+            dest_path = os.path.join(self.overlays_dir, base_name)
 
             try:
                 import shutil
@@ -771,11 +1312,7 @@ class MediaGallery(QtWidgets.QDialog):
                 QtWidgets.QMessageBox.warning(self, "Error", f"Failed to add image: {e}")
                 return
 
-            for i in reversed(range(self.grid_layout.count())):
-                widget_to_remove = self.grid_layout.itemAt(i).widget()
-                self.grid_layout.removeWidget(widget_to_remove)
-                widget_to_remove.setParent(None)
-            self.load_images()
+            self.add_image_tile(dest_path)
 
     def select_image(self, image_path, button):
         self.selected_image_path = image_path
@@ -787,6 +1324,25 @@ class MediaGallery(QtWidgets.QDialog):
         sender = self.sender()
         sender.setStyleSheet("border: 2px solid #00aaff;")
 
+    def remove_image_tile(self, image_path, button):
+        """Drop a single tile from the grid without reloading the gallery"""
+        self.image_buttons.remove(button)
+        self.thumbnail_buttons.pop(image_path, None)
+        self.grid_layout.removeWidget(button.tile_widget)
+        button.tile_widget.setParent(None)
+        button.tile_widget.deleteLater()
+
+        widgets = [self.grid_layout.itemAt(i).widget() for i in range(self.grid_layout.count())]
+        # Re-flow with the layout frozen so the grid is laid out and painted once
+        self.grid_widget.setUpdatesEnabled(False)
+        self.grid_layout.setEnabled(False)
+        for widget in widgets:
+            self.grid_layout.removeWidget(widget)
+        for index, widget in enumerate(widgets):
+            self.grid_layout.addWidget(widget, *divmod(index, self.max_cols))
+        self.grid_layout.setEnabled(True)
+        self.grid_widget.setUpdatesEnabled(True)
+
     def accept(self):
         if self.selected_image_path:
             super().accept()
@@ -802,17 +1358,16 @@ class MediaGallery(QtWidgets.QDialog):
                 QtWidgets.QMessageBox.No)
             if reply == QtWidgets.QMessageBox.Yes:
                 try:
+                    thumb_path = self.thumb_path(self.selected_image_path)
                     os.remove(self.selected_image_path)
+                    if os.path.exists(thumb_path):
+                        os.remove(thumb_path)
                 except Exception as e:
                     QtWidgets.QMessageBox.warning(self, "Error", f"Failed to delete image: {e}")
                     return
+                self.remove_image_tile(self.selected_image_path, self.selected_button)
                 self.selected_image_path = None
                 self.selected_button = None
-                for i in reversed(range(self.grid_layout.count())):
-                    widget_to_remove = self.grid_layout.itemAt(i).widget()
-                    self.grid_layout.removeWidget(widget_to_remove)
-                    widget_to_remove.setParent(None)
-                self.load_images()
             event.accept()
         else:
             super().keyPressEvent(event)
@@ -821,16 +1376,30 @@ class OptimizedImageOverlay(OverlayWindow):
     """Enhanced overlay window with optimized image rendering"""
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.renderer = CachedImageRenderer(self.advanced_settings)
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._apply_resize)
         
     def initImage(self):
+        if not hasattr(self, 'renderer'):
+            self.renderer = CachedImageRenderer(self.advanced_settings, self)
+            self._px_cache = OrderedDict()
+            self._px_cache_cap = 8
+        self.renderer.forget_content_keys()
+        self._last_render_key = None
+        self._preview_source = None
+        self.release_image_resources()
         if hasattr(self, 'label'):
             self.label.setParent(None)
             del self.label
+        if hasattr(self, 'movie'):
+            self.movie.stop()
+            del self.movie
             
-        if self.image_path.lower().endswith('.gif'):
+        if self.is_gif:
             
             self.initGifImage()
+            self.attachLabel()
         else:
             
             self.initStillImage()
@@ -844,39 +1413,119 @@ class OptimizedImageOverlay(OverlayWindow):
                 self.advanced_settings
             )
         else:
-            self.label = QtWidgets.QLabel(self)
-            pixmap = self.renderer.load_image(
-                self.image_path,
-                self.size(),
-                self.scaling_mode,
-                self.scale_factor
-            )
+            self.label = PixmapView(parent=self)
+            pixmap = self._scaled_pixmap()
             
             if pixmap:
                 self.label.setPixmap(pixmap)
-                self.label.setAlignment(QtCore.Qt.AlignCenter)
-                self.label.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
+                self._last_render_key = self._render_key()
+                self._preview_source = pixmap
                 
         
-        if not self.layout():
-            layout = QtWidgets.QVBoxLayout()
-            layout.setContentsMargins(0, 0, 0, 0)
-            self.setLayout(layout)
-        self.layout().addWidget(self.label)
+        self.attachLabel()
         
+    def _render_key(self):
+        return (self.image_path, self.width(), self.height(), self.scaling_mode, self.scale_factor)
+
+    def release_image_resources(self):
+        super().release_image_resources()
+        if hasattr(self, '_px_cache'):
+            self._px_cache.clear()
+
+    def _scaled_pixmap(self):
+        """Return the pixmap for the current render key, reusing recently shown sizes"""
+        try:
+            mtime_ns = os.stat(self.image_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        key = (self._render_key(), mtime_ns, self.advanced_settings.get('enable_antialiasing', True))
+        pixmap = self._px_cache.get(key)
+        if pixmap is not None:
+            self._px_cache.move_to_end(key)
+            return pixmap
+            
+        pixmap = self.renderer.load_image(
+            self.image_path,
+            self.size(),
+            self.scaling_mode,
+            self.scale_factor
+        )
+        if pixmap and not self.advanced_settings.get('low_memory_mode', False):
+            self._px_cache[key] = pixmap
+            if len(self._px_cache) > self._px_cache_cap:
+                self._px_cache.popitem(last=False)
+        return pixmap
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         
-        if hasattr(self, 'label') and not isinstance(self.label, TiledImageWidget):
-            if not self.image_path.lower().endswith('.gif'):
-                pixmap = self.renderer.load_image(
-                    self.image_path,
-                    self.size(),
-                    self.scaling_mode,
-                    self.scale_factor
+        if (hasattr(self, '_resize_timer') and isinstance(getattr(self, 'label', None), PixmapView) and
+                self._render_key() != getattr(self, '_last_render_key', None)):
+            preview = getattr(self, '_preview_source', None)
+            if preview and self.scaling_mode in ('fit', 'stretch'):
+                # Cheap nearest-neighbour preview until the debounced smooth render lands
+                target_size = QtCore.QSize(
+                    max(1, int(self.width() * self.scale_factor)),
+                    max(1, int(self.height() * self.scale_factor))
                 )
+                self.label.setPixmap(preview.scaled(
+                    target_size,
+                    QtCore.Qt.KeepAspectRatio if self.scaling_mode == 'fit' else QtCore.Qt.IgnoreAspectRatio,
+                    QtCore.Qt.FastTransformation
+                ))
+            self._resize_timer.start(60)
+            
+    def _apply_resize(self):
+        if hasattr(self, 'label') and not isinstance(self.label, TiledImageWidget):
+            render_key = self._render_key()
+            if not self.is_gif and render_key != self._last_render_key:
+                pixmap = self._scaled_pixmap()
                 if pixmap:
                     self.label.setPixmap(pixmap)
+                    self._last_render_key = render_key
+                    self._preview_source = pixmap
+
+class HotkeyEventFilter(QtCore.QAbstractNativeEventFilter):
+    """Turns WM_HOTKEY messages from RegisterHotKey into a callback on the GUI thread"""
+    def __init__(self, hotkey_id, callback):
+        super().__init__()
+        self.hotkey_id = hotkey_id
+        self.callback = callback
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b'windows_generic_MSG':
+            msg = MSG.from_address(int(message))
+            if msg.message == WM_HOTKEY and msg.wParam == self.hotkey_id:
+                self.callback()
+                return True, 0
+        return False, 0
+
+class SettingsWriterSignals(QtCore.QObject):
+    failed = QtCore.pyqtSignal(bytes)
+
+
+class SettingsWriter(QtCore.QRunnable):
+    """Writes a serialized settings payload on a worker thread"""
+    def __init__(self, settings_file, data, settings_hash=b''):
+        super().__init__()
+        self.settings_file = settings_file
+        self.data = data
+        self.settings_hash = settings_hash
+        self.signals = SettingsWriterSignals()
+
+    def run(self):
+        try:
+            # Write beside the target and swap it in so a crash never leaves a truncated file
+            temp_file = self.settings_file + '.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(self.data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.settings_file)
+        except Exception as e:
+            print(f"Error saving settings: {e}")
+            self.signals.failed.emit(self.settings_hash)
+
 
 class AnyOverlay(QtWidgets.QWidget):
     overlay_toggle_signal = QtCore.pyqtSignal()
@@ -884,6 +1533,10 @@ class AnyOverlay(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
         self.overlay_window = None
+        self._hidden_overlay_signature = None
+        self._hotkey_handle = None
+        self._native_hotkey = False
+        self._shortcut_bound = False
         self.is_overlay_visible = False
         self.global_hotkey = 'ctrl+alt+o'
         self.image_path = None
@@ -894,10 +1547,33 @@ class AnyOverlay(QtWidgets.QWidget):
         self.gif_speed = 100
         self.is_gif = False
         self.scaling_mode = 'fit'
+        self._is_tile = False
         self.toggle_timer = QtCore.QTimer()
         self.toggle_timer.setSingleShot(True)
         self.toggle_timer.timeout.connect(self.perform_toggle)
         self.toggle_delay = 200
+        self.save_timer = QtCore.QTimer()
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self._do_save_settings)
+        self.save_delay = 300
+        # A single worker keeps settings writes in submission order
+        self.save_pool = QtCore.QThreadPool()
+        self.save_pool.setMaxThreadCount(1)
+        self.refresh_timer = QtCore.QTimer()
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(40)
+        self.refresh_timer.timeout.connect(self.refresh_overlay)
+        self.opacity_timer = QtCore.QTimer()
+        self.opacity_timer.setSingleShot(True)
+        self.opacity_timer.setInterval(50)
+        self.opacity_timer.timeout.connect(self.apply_opacity)
+        self._last_settings_hash = None
+        self._save_pending = False
+        atexit.register(self._atexit_flush)
+        self._screens_cache = QtWidgets.QApplication.screens()
+        app = QtWidgets.QApplication.instance()
+        app.screenAdded.connect(self._refresh_screens)
+        app.screenRemoved.connect(self._refresh_screens)
         self.edit_mode = False
         self.advanced_settings = {
             'enable_hardware_acceleration': True,
@@ -909,17 +1585,22 @@ class AnyOverlay(QtWidgets.QWidget):
             'transparency': 0,
             'background_color': '#000000',
             'enable_scale_limits': True,
-            'scale_factor': 1.0  
+            'scale_factor': 1.0,
+            'gif_frame_buffer': 50,
+            'low_memory_mode': False
         }
+        self._default_advanced_settings = dict(self.advanced_settings)
         self.initUI()
         self.load_settings()
+        self._ensure_defaults()
+        self._clamp_enabled = bool(self.advanced_settings['enable_scale_limits'])
         self.start_hotkey_listener()
+        self.prefetch_overlay_image()
 
     def initUI(self):
         self.setWindowTitle('AnyOverlay')
         self.resize(500, 500)
-
-        self.apply_dark_theme()
+        self.setStyleSheet(DARK_STYLESHEET)
 
         main_layout = QtWidgets.QVBoxLayout()
 
@@ -931,9 +1612,7 @@ class AnyOverlay(QtWidgets.QWidget):
         display_label = QtWidgets.QLabel('Display:')
         display_layout.addWidget(display_label)
         self.display_combo = QtWidgets.QComboBox()
-        screens = QtWidgets.QApplication.screens()
-        for i, screen in enumerate(screens):
-            self.display_combo.addItem(f'Display {i+1}')
+        self.display_combo.addItems(self._display_labels())
         self.display_combo.setCurrentIndex(self.display_index)
         self.display_combo.currentIndexChanged.connect(self.on_display_changed)
         display_layout.addWidget(self.display_combo)
@@ -947,6 +1626,7 @@ class AnyOverlay(QtWidgets.QWidget):
         self.opacity_slider.setMaximum(100)
         self.opacity_slider.setValue(int(self.opacity * 100))
         self.opacity_slider.valueChanged.connect(self.on_opacity_changed)
+        self.opacity_slider.sliderReleased.connect(self.apply_opacity)
         opacity_layout.addWidget(self.opacity_slider)
         main_layout.addLayout(opacity_layout)
 
@@ -975,36 +1655,11 @@ class AnyOverlay(QtWidgets.QWidget):
         self.tabs = QtWidgets.QTabWidget()
         main_layout.addWidget(self.tabs)
 
-        self.tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #555555;
-                border-radius: 4px;
-                background-color: #2b2b2b;
-            }
-            QTabBar::tab {
-                background-color: #3c3f41;
-                color: #ffffff;
-                padding: 5px;
-                border: 1px solid #3c3f41;
-                border-bottom-color: #2b2b2b;
-                min-width: 100px;
-            }
-            QTabBar::tab:selected {
-                background-color: #4b4b4b;
-                border-bottom-color: #4b4b4b;
-            }
-            QTabBar::tab:hover {
-                background-color: #4b4b4b;
-            }
-        """)
-
         self.rendering_tab = QtWidgets.QWidget()
         self.rendering_layout = QtWidgets.QVBoxLayout()
         self.rendering_layout.setAlignment(QtCore.Qt.AlignTop)
         self.rendering_tab.setLayout(self.rendering_layout)
         
-        self.add_rendering_options()
-        
         self.tabs.addTab(self.rendering_tab, "Rendering Options")
 
 
@@ -1013,14 +1668,6 @@ class AnyOverlay(QtWidgets.QWidget):
         self.gif_layout.setAlignment(QtCore.Qt.AlignTop)
         self.gif_tab.setLayout(self.gif_layout)
 
-        gif_speed_layout = QtWidgets.QHBoxLayout()
-        self.gif_speed_label = QtWidgets.QLabel('Playback Speed (%):')
-        gif_speed_layout.addWidget(self.gif_speed_label)
-        self.gif_speed_input = QtWidgets.QLineEdit(str(self.gif_speed))
-        self.gif_speed_input.editingFinished.connect(self.on_gif_speed_changed)
-        gif_speed_layout.addWidget(self.gif_speed_input)
-        self.gif_layout.addLayout(gif_speed_layout)
-
         self.tabs.addTab(self.gif_tab, "GIF Options")
 
         self.advanced_tab = QtWidgets.QWidget()
@@ -1028,16 +1675,54 @@ class AnyOverlay(QtWidgets.QWidget):
         self.advanced_layout.setAlignment(QtCore.Qt.AlignTop)
         self.advanced_tab.setLayout(self.advanced_layout)
 
-        self.add_advanced_options()
-
         self.tabs.addTab(self.advanced_tab, "Advanced Options")
 
+        # Tab contents are only built the first time each tab is shown
+        self._tab_builders = {
+            0: self.add_rendering_options,
+            1: self.add_gif_options,
+            2: self.add_advanced_options
+        }
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tabs.currentIndex())
+
         self.setLayout(main_layout)
 
-        self.overlay_toggle_signal.connect(self.toggle_overlay)
+        # The hotkey fires on the keyboard hook thread; queue the toggle onto the GUI thread explicitly
+        self.overlay_toggle_signal.connect(self.on_global_hotkey, QtCore.Qt.QueuedConnection)
+
+        # Scale shortcuts go through Qt's event loop; only the toggle needs a global hook
+        QtWidgets.QShortcut(QtGui.QKeySequence("Ctrl+="), self, activated=self.increase_scale)
+        QtWidgets.QShortcut(QtGui.QKeySequence("Ctrl+-"), self, activated=self.decrease_scale)
+        # While any of our windows has focus the toggle is served here; its key is bound with the global hotkey
+        self.toggle_shortcut = QtWidgets.QShortcut(self, activated=self.toggle_overlay)
+        self.toggle_shortcut.setContext(QtCore.Qt.ApplicationShortcut)
+        self.toggle_shortcut.setAutoRepeat(False)
 
         self.show()
 
+    def _ensure_tab_built(self, index):
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder()
+
+    def _make_spin_box(self, spin_box_class, minimum, maximum, value):
+        spin_box = spin_box_class()
+        spin_box.setRange(minimum, maximum)
+        spin_box.setValue(value)
+        # Only commit on Enter/focus-out or arrow steps, not on every typed digit
+        spin_box.setKeyboardTracking(False)
+        return spin_box
+
+    def add_gif_options(self):
+        gif_speed_layout = QtWidgets.QHBoxLayout()
+        self.gif_speed_label = QtWidgets.QLabel('Playback Speed (%):')
+        gif_speed_layout.addWidget(self.gif_speed_label)
+        self.gif_speed_input = self._make_spin_box(QtWidgets.QSpinBox, 1, 1000, self.gif_speed)
+        self.gif_speed_input.valueChanged.connect(self.on_gif_speed_changed)
+        gif_speed_layout.addWidget(self.gif_speed_input)
+        self.gif_layout.addLayout(gif_speed_layout)
+
     def add_advanced_options(self):
         hw_accel_layout = QtWidgets.QHBoxLayout()
         hw_accel_label = QtWidgets.QLabel('Enable Hardware Acceleration:')
@@ -1051,35 +1736,45 @@ class AnyOverlay(QtWidgets.QWidget):
         update_interval_layout = QtWidgets.QHBoxLayout()
         update_interval_label = QtWidgets.QLabel('Update Interval (ms):')
         update_interval_layout.addWidget(update_interval_label)
-        self.update_interval_input = QtWidgets.QLineEdit(str(self.advanced_settings['update_interval']))
-        self.update_interval_input.editingFinished.connect(self.on_update_interval_changed)
+        self.update_interval_input = self._make_spin_box(QtWidgets.QSpinBox, 0, 10000, self.advanced_settings['update_interval'])
+        self.update_interval_input.valueChanged.connect(self.on_update_interval_changed)
         update_interval_layout.addWidget(self.update_interval_input)
         self.advanced_layout.addLayout(update_interval_layout)
 
         tile_scale_layout = QtWidgets.QHBoxLayout()
         tile_scale_label = QtWidgets.QLabel('Tile Scale Factor:')
         tile_scale_layout.addWidget(tile_scale_label)
-        self.tile_scale_input = QtWidgets.QLineEdit(str(self.advanced_settings['tile_scale']))
-        self.tile_scale_input.editingFinished.connect(self.on_tile_scale_changed)
+        self.tile_scale_input = self._make_spin_box(QtWidgets.QDoubleSpinBox, 0.01, 10.0, self.advanced_settings['tile_scale'])
+        self.tile_scale_input.setSingleStep(0.1)
+        self.tile_scale_input.valueChanged.connect(self.on_tile_scale_changed)
         tile_scale_layout.addWidget(self.tile_scale_input)
         self.advanced_layout.addLayout(tile_scale_layout)
 
         cache_size_layout = QtWidgets.QHBoxLayout()
         cache_size_label = QtWidgets.QLabel('Cache Size (MB):')
         cache_size_layout.addWidget(cache_size_label)
-        self.cache_size_input = QtWidgets.QLineEdit(str(self.advanced_settings['cache_size']))
-        self.cache_size_input.editingFinished.connect(self.on_cache_size_changed)
+        self.cache_size_input = self._make_spin_box(QtWidgets.QSpinBox, 1, 4096, self.advanced_settings['cache_size'])
+        self.cache_size_input.valueChanged.connect(self.on_cache_size_changed)
         cache_size_layout.addWidget(self.cache_size_input)
         self.advanced_layout.addLayout(cache_size_layout)
 
         max_memory_layout = QtWidgets.QHBoxLayout()
         max_memory_label = QtWidgets.QLabel('Max Memory Usage (MB):')
         max_memory_layout.addWidget(max_memory_label)
-        self.max_memory_input = QtWidgets.QLineEdit(str(self.advanced_settings['max_memory_usage']))
-        self.max_memory_input.editingFinished.connect(self.on_max_memory_changed)
+        self.max_memory_input = self._make_spin_box(QtWidgets.QSpinBox, 16, 65536, self.advanced_settings['max_memory_usage'])
+        self.max_memory_input.valueChanged.connect(self.on_max_memory_changed)
         max_memory_layout.addWidget(self.max_memory_input)
         self.advanced_layout.addLayout(max_memory_layout)
 
+        low_memory_layout = QtWidgets.QHBoxLayout()
+        low_memory_label = QtWidgets.QLabel('Low Memory Mode:')
+        low_memory_layout.addWidget(low_memory_label)
+        self.low_memory_checkbox = QtWidgets.QCheckBox()
+        self.low_memory_checkbox.setChecked(self.advanced_settings['low_memory_mode'])
+        self.low_memory_checkbox.stateChanged.connect(self.on_low_memory_changed)
+        low_memory_layout.addWidget(self.low_memory_checkbox)
+        self.advanced_layout.addLayout(low_memory_layout)
+
         antialias_layout = QtWidgets.QHBoxLayout()
         antialias_label = QtWidgets.QLabel('Enable Antialiasing:')
         antialias_layout.addWidget(antialias_label)
@@ -1092,8 +1787,8 @@ class AnyOverlay(QtWidgets.QWidget):
         transparency_layout = QtWidgets.QHBoxLayout()
         transparency_label = QtWidgets.QLabel('Transparency Level (0-255):')
         transparency_layout.addWidget(transparency_label)
-        self.transparency_input = QtWidgets.QLineEdit(str(self.advanced_settings['transparency']))
-        self.transparency_input.editingFinished.connect(self.on_transparency_changed)
+        self.transparency_input = self._make_spin_box(QtWidgets.QSpinBox, 0, 255, self.advanced_settings['transparency'])
+        self.transparency_input.valueChanged.connect(self.on_transparency_changed)
         transparency_layout.addWidget(self.transparency_input)
         self.advanced_layout.addLayout(transparency_layout)
 
@@ -1134,78 +1829,15 @@ class AnyOverlay(QtWidgets.QWidget):
         self.advanced_settings['scale_factor'] = value
         self.save_settings()
         if self.is_overlay_visible and self.overlay_window:
-            self.overlay_window.scale_factor = value
             self.overlay_window.initImage()
 
     def on_scale_limits_changed(self, state):
         self.advanced_settings['enable_scale_limits'] = bool(state)
+        self._clamp_enabled = bool(state)
         self.save_settings()
-        if self.is_overlay_visible and self.overlay_window:
+        if self.overlay_window:
             self.overlay_window.advanced_settings['enable_scale_limits'] = bool(state)
-
-    def apply_dark_theme(self):
-        dark_stylesheet = """
-        QWidget {
-            background-color: #2b2b2b;
-            color: #ffffff;
-            font-family: Arial;
-            font-size: 10pt;
-        }
-        QTabWidget::pane {
-            border: 1px solid #555555;
-            border-radius: 4px;
-            background-color: #2b2b2b;
-        }
-        QTabBar::tab {
-            background-color: #3c3f41;
-            color: #ffffff;
-            padding: 5px;
-            border: 1px solid #3c3f41;
-            border-bottom-color: #2b2b2b;
-            min-width: 100px;
-        }
-        QTabBar::tab:selected {
-            background-color: #4b4b4b;
-            border-bottom-color: #4b4b4b;
-        }
-        QTabBar::tab:hover {
-            background-color: #4b4b4b;
-        }
-        QPushButton {
-            background-color: #3c3f41;
-            color: #ffffff;
-            border: none;
-            padding: 5px;
-        }
-        QPushButton:hover {
-            background-color: #4b4b4b;
-        }
-        QLineEdit, QComboBox {
-            background-color: #3c3f41;
-            color: #ffffff;
-            border: 1px solid #555555;
-            padding: 2px;
-        }
-        QLabel {
-            color: #ffffff;
-        }
-        QSlider::groove:horizontal {
-            border: 1px solid #3A3939;
-            height: 8px;
-            background: #201F1F;
-            margin: 0px;
-            border-radius: 2px;
-        }
-        QSlider::handle:horizontal {
-            background: #3c3f41;
-            border: 1px solid #3A3939;
-            width: 14px;
-            height: 14px;
-            margin: -3px 0;
-            border-radius: 7px;
-        }
-        """
-        self.setStyleSheet(dark_stylesheet)
+            self.overlay_window._clamp_enabled = bool(state)
 
     def open_media_gallery(self):
         gallery = MediaGallery(self.overlays_dir, self)
@@ -1214,9 +1846,12 @@ class AnyOverlay(QtWidgets.QWidget):
             self.is_gif = self.image_path.lower().endswith('.gif') if self.image_path else False
             self.update_gif_options_visibility()
             self.save_settings()
-            if self.is_overlay_visible:
-                self.destroy_overlay()
+            if self.is_overlay_visible and self.overlay_window:
+                self.overlay_window.setImage(self.image_path)
+            elif self.is_overlay_visible:
                 self.create_overlay()
+            else:
+                self.prefetch_overlay_image()
 
     def update_gif_options_visibility(self):
         if self.is_gif:
@@ -1250,12 +1885,13 @@ class AnyOverlay(QtWidgets.QWidget):
             self.create_overlay()
 
     def create_overlay(self):
-        if not self.image_path or not os.path.exists(self.image_path):
+        # The signature's stat doubles as the existence check: its mtime is None for a missing file
+        signature = self._overlay_signature()
+        if not self.image_path or signature[1] is None:
             QtWidgets.QMessageBox.warning(self, "Warning", "No image selected.")
             return
 
-        screens = QtWidgets.QApplication.screens()
-        if self.display_index >= len(screens):
+        if self.display_index >= len(self._screens_cache):
             QtWidgets.QMessageBox.warning(self, "Warning", "Invalid display selected.")
             return
 
@@ -1274,40 +1910,178 @@ class AnyOverlay(QtWidgets.QWidget):
             self.overlay_window.setGeometry(geometry)
             self.overlay_window.setOpacity(self.opacity)
             self.overlay_window.setGifSpeed(self.gif_speed)
-            self.overlay_window.setScalingMode(self.scaling_mode)
-            self.overlay_window.advanced_settings = self.advanced_settings
-            self.overlay_window.scale_factor = self.advanced_settings.get('scale_factor', 1.0)
-            self.overlay_window.initImage()
-            self.overlay_window.setImage(self.image_path)
+            # Cheap to re-apply, and may have been changed while the window was hidden
+            self.overlay_window.setBackground(self.advanced_settings['background_color'],
+                                              self.advanced_settings['transparency'])
+            self.overlay_window.setUpdateInterval(self.advanced_settings['update_interval'])
+            # A hidden overlay whose signature still matches already holds the right render
+            # for this file version and screen size, so only rebuild if something changed
+            if signature != self._hidden_overlay_signature:
+                self.overlay_window.image_path = self.image_path
+                self.overlay_window.scaling_mode = self.scaling_mode
+                self.overlay_window._is_tile = self._is_tile
+                self.overlay_window.advanced_settings = self.advanced_settings
+                self.overlay_window._clamp_enabled = self._clamp_enabled
+                self.overlay_window.initImage()
 
+        self.attach_overlay_screen()
         self.overlay_window.showFullScreen()
         self.overlay_window.set_edit_mode(self.edit_mode)
         self.is_overlay_visible = True
 
+    def prefetch_overlay_image(self):
+        """Decode the still image on a worker while no overlay shows it, so the next toggle only uploads it"""
+        if self.is_overlay_visible or not self.image_path or self.is_gif:
+            return
+        if self.advanced_settings.get('low_memory_mode', False):
+            return
+        if self.overlay_window is not None and self._overlay_signature() == self._hidden_overlay_signature:
+            return
+        decode_key = self._current_decode_key()
+        if decode_key is None or decode_key in _PREFETCHED_STILLS:
+            return
+        task = StillImagePrefetch(decode_key, self.image_path, self.scaling_mode, self.get_screen_geometry().size(),
+                                  self.advanced_settings.get('scale_factor', 1.0),
+                                  self.advanced_settings.get('tile_scale', 1.0))
+        task.signals.done.connect(self.on_prefetch_done)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def on_prefetch_done(self, decode_key, image):
+        # The overlay may have been shown, or the image, mode or screen changed, while the worker ran
+        if image.isNull() or self.is_overlay_visible:
+            return
+        if self.advanced_settings.get('low_memory_mode', False):
+            return
+        if decode_key != self._current_decode_key():
+            return
+        _PREFETCHED_STILLS.clear()
+        _PREFETCHED_STILLS[decode_key] = image
+
+    def _current_decode_key(self):
+        if not self.image_path:
+            return None
+        try:
+            stat = os.stat(self.image_path)
+        except OSError:
+            return None
+        return still_decode_key(self.image_path, stat.st_mtime_ns, self.scaling_mode,
+                                self.get_screen_geometry().size(),
+                                self.advanced_settings.get('scale_factor', 1.0),
+                                self.advanced_settings.get('tile_scale', 1.0))
+
+    def _overlay_signature(self):
+        # Screen size and mtime are part of it so a hidden overlay is re-rendered for a new display or an edited file
+        try:
+            mtime_ns = os.stat(self.image_path).st_mtime_ns if self.image_path else None
+        except OSError:
+            mtime_ns = None
+        return (self.image_path, mtime_ns, self.get_screen_geometry().size(), self.scaling_mode,
+                settings_dumps(self.advanced_settings))
+
     def destroy_overlay(self):
-        if self.overlay_window:
-            self.overlay_window.hide()
+        if self.overlay_window and self.advanced_settings.get('low_memory_mode', False):
+            # Give the decoded image back rather than keeping the window warm for the next toggle
+            self.overlay_window.release_image_resources()
+            self.overlay_window.close()
             self.overlay_window.deleteLater()
             self.overlay_window = None
+            self._hidden_overlay_signature = None
+            # Queued behind the deferred delete so the window's own pixmaps are gone before trimming
+            QtCore.QTimer.singleShot(0, purge_memory)
+        elif self.overlay_window:
+            # Hide instead of deleting so the next toggle is just a show()
+            self.overlay_window.hide()
+            self._hidden_overlay_signature = self._overlay_signature()
         self.is_overlay_visible = False
 
+    def bind_toggle_shortcut(self, hotkey):
+        # Qt can't spell every hotkey the keyboard module accepts ('windows+f1', 'ctrl+shift'): those
+        # parse to Key_unknown and would never fire, so leave the shortcut unbound instead
+        sequence = QtGui.QKeySequence(hotkey or '')
+        key_mask = ~int(QtCore.Qt.KeyboardModifierMask)
+        self._shortcut_bound = sequence.count() > 0 and all(
+            sequence[i] & key_mask != QtCore.Qt.Key_unknown for i in range(sequence.count()))
+        self.toggle_shortcut.setKey(sequence if self._shortcut_bound else QtGui.QKeySequence())
+
     def start_hotkey_listener(self):
-        try:
-            import keyboard
-            keyboard.add_hotkey(self.global_hotkey, lambda: self.overlay_toggle_signal.emit())
-        except ImportError:
+        self.bind_toggle_shortcut(self.global_hotkey)
+        if self.register_native_hotkey():
+            return
+        if keyboard is None:
             QtWidgets.QMessageBox.warning(self, "Error", "The 'keyboard' module is required for hotkey functionality.")
             self.global_hotkey = None
+            return
+        self._hotkey_handle = self.add_keyboard_hotkey()
+
+    def on_global_hotkey(self):
+        # RegisterHotKey swallows the keystroke, but the keyboard hook doesn't: with the app
+        # focused toggle_shortcut has already handled it, if Qt could bind the hotkey at all
+        if self._native_hotkey or not self._shortcut_bound or QtWidgets.QApplication.activeWindow() is None:
+            self.toggle_overlay()
+
+    def add_keyboard_hotkey(self):
+        # Firing on release gives one toggle per physical press; on press, a held combination
+        # would auto-repeat and flip the overlay several times a second
+        return keyboard.add_hotkey(self.global_hotkey, self.overlay_toggle_signal.emit, trigger_on_release=True)
+
+    def register_native_hotkey(self):
+        """Bind the hotkey with RegisterHotKey on Windows so no system-wide keyboard hook is needed"""
+        if sys.platform != "win32" or not self.global_hotkey:
+            return False
+        parsed = parse_hotkey(self.global_hotkey)
+        if parsed is None or not RegisterHotKey(None, HOTKEY_ID, parsed[0] | MOD_NOREPEAT, parsed[1]):
+            return False
+        if not hasattr(self, '_hotkey_filter'):
+            # Thread-level hotkeys arrive with no window, so they are caught at the dispatcher
+            self._hotkey_filter = HotkeyEventFilter(HOTKEY_ID, self.overlay_toggle_signal.emit)
+            QtWidgets.QApplication.instance().installNativeEventFilter(self._hotkey_filter)
+        self._native_hotkey = True
+        return True
+
+    def unregister_hotkey(self):
+        if self._native_hotkey:
+            UnregisterHotKey(None, HOTKEY_ID)
+            self._native_hotkey = False
+        if self._hotkey_handle is not None:
+            keyboard.remove_hotkey(self._hotkey_handle)
+            self._hotkey_handle = None
+
+    def _display_labels(self):
+        return [f'Display {i+1}' for i in range(len(self._screens_cache))]
+
+    def _refresh_screens(self, screen=None):
+        self._screens_cache = QtWidgets.QApplication.screens()
+        # Rebuilding the list must not look like the user picked another display
+        blocker = QtCore.QSignalBlocker(self.display_combo)
+        self.display_combo.clear()
+        self.display_combo.addItems(self._display_labels())
+        if self.display_index >= len(self._screens_cache):
+            self.display_index = 0
+        self.display_combo.setCurrentIndex(self.display_index)
+        blocker.unblock()
+        # The chosen display may be the one that went away; move a visible overlay to where it now belongs
+        self.on_display_changed(self.display_index)
+
+    def get_screen(self):
+        if self.display_index >= len(self._screens_cache):
+            return QtWidgets.QApplication.primaryScreen()
+        return self._screens_cache[self.display_index]
 
     def get_screen_geometry(self):
-        screens = QtWidgets.QApplication.screens()
-        if self.display_index >= len(screens):
-            return QtWidgets.QApplication.primaryScreen().geometry()
-        return screens[self.display_index].geometry()
+        return self.get_screen().geometry()
+
+    def attach_overlay_screen(self):
+        """Bind the overlay's native window to the chosen screen so showFullScreen maps it there directly"""
+        # winId() creates the native window, and with it the QWindow, if it doesn't exist yet
+        self.overlay_window.winId()
+        handle = self.overlay_window.windowHandle()
+        screen = self.get_screen()
+        if handle.screen() is not screen:
+            handle.setScreen(screen)
 
     def on_scaling_mode_changed(self, index):
-        scaling_modes = ['fit', 'stretch', 'center', 'tile']
-        self.scaling_mode = scaling_modes[index]
+        self.scaling_mode = SCALING_MODES[index]
+        self._is_tile = self.scaling_mode == 'tile'
         self.save_settings()
         if self.is_overlay_visible and self.overlay_window:
             self.overlay_window.setScalingMode(self.scaling_mode)
@@ -1319,94 +2093,97 @@ class AnyOverlay(QtWidgets.QWidget):
             if self.overlay_window:
                 geometry = self.get_screen_geometry()
                 self.overlay_window.setGeometry(geometry)
-                self.overlay_window.update()
+                # A full-screen window stays on its screen until it is re-targeted and re-shown
+                self.attach_overlay_screen()
+                self.overlay_window.showFullScreen()
 
     def on_opacity_changed(self, value):
         self.opacity = value / 100.0
         self.save_settings()
-        if self.is_overlay_visible and self.overlay_window:
+        # Throttle layered-window alpha updates during a drag; the timeout applies the final value
+        if not self.opacity_timer.isActive():
+            self.apply_opacity()
+            self.opacity_timer.start()
+
+    def apply_opacity(self):
+        if self.is_overlay_visible and self.overlay_window and self.overlay_window.opacity != self.opacity:
             self.overlay_window.setOpacity(self.opacity)
 
-    def on_gif_speed_changed(self):
-        try:
-            value = int(self.gif_speed_input.text())
-            self.gif_speed = value
-            self.save_settings()
-            if self.is_overlay_visible and self.overlay_window:
-                self.overlay_window.setGifSpeed(self.gif_speed)
-        except ValueError:
-            QtWidgets.QMessageBox.warning(self, "Invalid Value", "Please enter a valid integer.")
-            self.gif_speed_input.setText(str(self.gif_speed))
+    def on_gif_speed_changed(self, value):
+        self.gif_speed = value
+        self.save_settings()
+        if self.is_overlay_visible and self.overlay_window:
+            self.overlay_window.setGifSpeed(self.gif_speed)
 
     def on_set_hotkey(self):
-        self.global_hotkey = self.hotkey_entry.text()
-        if self.global_hotkey:
-            try:
-                import keyboard
-                keyboard.unhook_all_hotkeys()
-                keyboard.add_hotkey(self.global_hotkey, lambda: self.overlay_toggle_signal.emit())
-                self.save_settings()
-            except Exception as e:
-                QtWidgets.QMessageBox.warning(self, "Error", f"Failed to set hotkey: {e}")
-        else:
+        hotkey = self.hotkey_entry.text().strip()
+        if not hotkey:
             QtWidgets.QMessageBox.warning(self, "Invalid Hotkey", "Hotkey cannot be empty.")
+            return
+        if hotkey == self.global_hotkey and (self._native_hotkey or self._hotkey_handle is not None):
+            return
+        # Validate before unbinding, so a typo leaves the current hotkey working
+        if not self.hotkey_is_valid(hotkey):
+            QtWidgets.QMessageBox.warning(self, "Invalid Hotkey", f"'{hotkey}' is not a recognised hotkey.")
+            return
+        self.global_hotkey = hotkey
+        self.bind_toggle_shortcut(self.global_hotkey)
+        self.unregister_hotkey()
+        if self.register_native_hotkey():
+            self.save_settings()
+            return
+        if keyboard is None:
+            QtWidgets.QMessageBox.warning(self, "Error", "The 'keyboard' module is required for hotkey functionality.")
+            return
+        try:
+            self._hotkey_handle = self.add_keyboard_hotkey()
+            self.save_settings()
+        except Exception as e:
+            QtWidgets.QMessageBox.warning(self, "Error", f"Failed to set hotkey: {e}")
+
+    def hotkey_is_valid(self, hotkey):
+        if sys.platform == "win32" and parse_hotkey(hotkey) is not None:
+            return True
+        if keyboard is None:
+            # Nothing to check against; registration reports the missing module
+            return True
+        try:
+            keyboard.parse_hotkey(hotkey)
+        except ValueError:
+            return False
+        return True
 
     def on_hw_accel_changed(self, state):
         self.advanced_settings['enable_hardware_acceleration'] = bool(state)
         self.save_settings()
 
-    def on_update_interval_changed(self):
-        try:
-            value = int(self.update_interval_input.text())
-            self.advanced_settings['update_interval'] = value
-            self.save_settings()
-            if self.is_overlay_visible and self.overlay_window:
-                if value > 0:
-                    if hasattr(self.overlay_window, 'update_timer'):
-                        self.overlay_window.update_timer.setInterval(value)
-                    else:
-                        self.overlay_window.update_timer = QtCore.QTimer(self.overlay_window)
-                        self.overlay_window.update_timer.timeout.connect(self.overlay_window.update)
-                        self.overlay_window.update_timer.start(value)
-                else:
-                    if hasattr(self.overlay_window, 'update_timer'):
-                        self.overlay_window.update_timer.stop()
-                        del self.overlay_window.update_timer
-        except ValueError:
-            QtWidgets.QMessageBox.warning(self, "Invalid Value", "Please enter a valid integer.")
-            self.update_interval_input.setText(str(self.advanced_settings['update_interval']))
+    def on_update_interval_changed(self, value):
+        self.advanced_settings['update_interval'] = value
+        self.save_settings()
+        if self.overlay_window:
+            self.overlay_window.setUpdateInterval(value)
 
-    def on_tile_scale_changed(self):
-        try:
-            value = float(self.tile_scale_input.text())
-            self.advanced_settings['tile_scale'] = value
-            self.save_settings()
-            if self.is_overlay_visible and self.overlay_window:
-                self.overlay_window.initImage()
-        except ValueError:
-            QtWidgets.QMessageBox.warning(self, "Invalid Value", "Please enter a valid number.")
-            self.tile_scale_input.setText(str(self.advanced_settings['tile_scale']))
+    def on_tile_scale_changed(self, value):
+        self.advanced_settings['tile_scale'] = value
+        self.save_settings()
+        if self.is_overlay_visible and self.overlay_window:
+            self.overlay_window.initImage()
 
-    def on_cache_size_changed(self):
-        try:
-            value = int(self.cache_size_input.text())
-            self.advanced_settings['cache_size'] = value
-            self.save_settings()
-            if self.is_overlay_visible and self.overlay_window:
-                QtGui.QPixmapCache.setCacheLimit(value * 1024)
-        except ValueError:
-            QtWidgets.QMessageBox.warning(self, "Invalid Value", "Please enter a valid integer.")
-            self.cache_size_input.setText(str(self.advanced_settings['cache_size']))
+    def on_cache_size_changed(self, value):
+        self.advanced_settings['cache_size'] = value
+        self.save_settings()
+        if self.is_overlay_visible and self.overlay_window:
+            QtGui.QPixmapCache.setCacheLimit(value * 1024)
 
-    def on_max_memory_changed(self):
-        try:
-            value = int(self.max_memory_input.text())
-            self.advanced_settings['max_memory_usage'] = value
-            self.save_settings()
+    def on_max_memory_changed(self, value):
+        self.advanced_settings['max_memory_usage'] = value
+        self.save_settings()
 
-        except ValueError:
-            QtWidgets.QMessageBox.warning(self, "Invalid Value", "Please enter a valid integer.")
-            self.max_memory_input.setText(str(self.advanced_settings['max_memory_usage']))
+    def on_low_memory_changed(self, state):
+        self.advanced_settings['low_memory_mode'] = bool(state)
+        self.save_settings()
+        if state:
+            _PREFETCHED_STILLS.clear()
 
     def on_antialias_changed(self, state):
         self.advanced_settings['enable_antialiasing'] = bool(state)
@@ -1415,19 +2192,11 @@ class AnyOverlay(QtWidgets.QWidget):
             self.overlay_window.advanced_settings['enable_antialiasing'] = bool(state)
             self.overlay_window.initImage()
 
-    def on_transparency_changed(self):
-        try:
-            value = int(self.transparency_input.text())
-            if 0 <= value <= 255:
-                self.advanced_settings['transparency'] = value
-                self.save_settings()
-                if self.is_overlay_visible and self.overlay_window:
-                    self.overlay_window.initUI()
-            else:
-                raise ValueError
-        except ValueError:
-            QtWidgets.QMessageBox.warning(self, "Invalid Value", "Please enter a valid integer between 0 and 255.")
-            self.transparency_input.setText(str(self.advanced_settings['transparency']))
+    def on_transparency_changed(self, value):
+        self.advanced_settings['transparency'] = value
+        self.save_settings()
+        if self.overlay_window:
+            self.overlay_window.setBackground(self.advanced_settings['background_color'], self.advanced_settings['transparency'])
 
     def on_bg_color_changed(self):
         color = self.bg_color_input.text()
@@ -1437,20 +2206,26 @@ class AnyOverlay(QtWidgets.QWidget):
             return
         self.advanced_settings['background_color'] = color
         self.save_settings()
-        if self.is_overlay_visible and self.overlay_window:
-            self.overlay_window.initUI()
+        if self.overlay_window:
+            self.overlay_window.setBackground(self.advanced_settings['background_color'], self.advanced_settings['transparency'])
+
+    def _ensure_defaults(self):
+        """Fill in advanced settings missing from an older settings file"""
+        for key, value in self._default_advanced_settings.items():
+            self.advanced_settings.setdefault(key, value)
 
     def load_settings(self):
-        if os.path.exists(self.settings_file):
+        if os.path.isfile(self.settings_file):
             try:
-                with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
+                with open(self.settings_file, 'rb') as f:
+                    settings = settings_loads(f.read())
                     self.image_path = settings.get('image_path', None)
                     self.display_index = settings.get('display_index', 0)
                     self.global_hotkey = settings.get('global_hotkey', 'ctrl+alt+o')
                     self.opacity = settings.get('opacity', 1.0)
                     self.gif_speed = settings.get('gif_speed', 100)
                     self.scaling_mode = settings.get('scaling_mode', 'fit')
+                    self._is_tile = self.scaling_mode == 'tile'
                     self.advanced_settings = settings.get('advanced_settings', self.advanced_settings)
                     self.scale_factor = self.advanced_settings.get('scale_factor', 1.0)
                     self.is_gif = self.image_path.lower().endswith('.gif') if self.image_path else False
@@ -1459,20 +2234,23 @@ class AnyOverlay(QtWidgets.QWidget):
                     self.hotkey_entry.setText(self.global_hotkey)
                     self.opacity_slider.setValue(int(self.opacity * 100))
                     self.display_combo.setCurrentIndex(self.display_index)
-                    scaling_modes = ['fit', 'stretch', 'center', 'tile']
-                    index = scaling_modes.index(self.scaling_mode) if self.scaling_mode in scaling_modes else 0
-                    self.scaling_mode_combo.setCurrentIndex(index)
-                    self.gif_speed_input.setText(str(self.gif_speed))
-
-                    self.hw_accel_checkbox.setChecked(self.advanced_settings['enable_hardware_acceleration'])
-                    self.update_interval_input.setText(str(self.advanced_settings['update_interval']))
-                    self.tile_scale_input.setText(str(self.advanced_settings['tile_scale']))
-                    self.cache_size_input.setText(str(self.advanced_settings['cache_size']))
-                    self.max_memory_input.setText(str(self.advanced_settings['max_memory_usage']))
-                    self.antialias_checkbox.setChecked(self.advanced_settings['enable_antialiasing'])
-                    self.transparency_input.setText(str(self.advanced_settings['transparency']))
-                    self.bg_color_input.setText(self.advanced_settings['background_color'])
-                    self.scale_limits_checkbox.setChecked(self.advanced_settings.get('enable_scale_limits', True))
+                    self.scaling_mode_combo.setCurrentIndex(SCALING_MODE_INDEX.get(self.scaling_mode, 0))
+                    # Lazily built tabs read the loaded values when they are first shown
+                    if hasattr(self, 'gif_speed_input'):
+                        self.gif_speed_input.setValue(int(self.gif_speed))
+
+                    if hasattr(self, 'hw_accel_checkbox'):
+                        self.hw_accel_checkbox.setChecked(self.advanced_settings['enable_hardware_acceleration'])
+                        self.update_interval_input.setValue(int(self.advanced_settings['update_interval']))
+                        self.tile_scale_input.setValue(self.advanced_settings['tile_scale'])
+                        self.cache_size_input.setValue(int(self.advanced_settings['cache_size']))
+                        self.max_memory_input.setValue(int(self.advanced_settings['max_memory_usage']))
+                        self.low_memory_checkbox.setChecked(self.advanced_settings.get('low_memory_mode', False))
+                        self.antialias_checkbox.setChecked(self.advanced_settings['enable_antialiasing'])
+                        self.transparency_input.setValue(int(self.advanced_settings['transparency']))
+                        self.bg_color_input.setText(self.advanced_settings['background_color'])
+                    if hasattr(self, 'scale_limits_checkbox'):
+                        self.scale_limits_checkbox.setChecked(self.advanced_settings.get('enable_scale_limits', True))
                     scale_factor = self.advanced_settings.get('scale_factor', 1.0)
                     if hasattr(self, 'scale_factor_input'):
                         self.scale_factor_input.setValue(scale_factor)
@@ -1481,81 +2259,92 @@ class AnyOverlay(QtWidgets.QWidget):
                 print(f"Error loading settings: {e}")
 
     def save_settings(self):
-        settings = {
-            'image_path': self.image_path,
-            'display_index': self.display_index,
-            'global_hotkey': self.global_hotkey,
-            'opacity': self.opacity,
-            'gif_speed': self.gif_speed,
-            'scaling_mode': self.scaling_mode,
-            'advanced_settings': self.advanced_settings
-        }
-        
-        if self.overlay_window:
-            settings['advanced_settings']['scale_factor'] = self.overlay_window.scale_factor
-        try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f)
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+        """Coalesce bursts of setting changes into a single write"""
+        self._save_pending = True
+        self.save_timer.start(self.save_delay)
+
+    def _collect_settings(self):
+        return dict(zip(SETTINGS_ATTRS, _settings_getter(self)))
+
+    def _do_save_settings(self):
+        self.save_timer.stop()
+        self._save_pending = False
+        data = settings_dumps(self._collect_settings())
+        settings_hash = hashlib.blake2b(data, digest_size=8).digest()
+        if settings_hash == self._last_settings_hash:
+            return
+        # Recorded up front so a repeat of this state isn't queued behind it; cleared again if the write fails
+        self._last_settings_hash = settings_hash
+        writer = SettingsWriter(self.settings_file, data, settings_hash)
+        writer.signals.failed.connect(self.on_settings_write_failed)
+        self.save_pool.start(writer)
+
+    def on_settings_write_failed(self, settings_hash):
+        # The file doesn't hold this state after all, so the next save of it must not be skipped
+        if self._last_settings_hash == settings_hash:
+            self._last_settings_hash = None
+
+    def _atexit_flush(self):
+        # Qt may already be torn down here, so write synchronously without the timer or pool
+        if self._save_pending:
+            self._save_pending = False
+            SettingsWriter(self.settings_file, settings_dumps(self._collect_settings())).run()
+
+    def _signal_flush(self, signum, frame):
+        self._atexit_flush()
+        QtWidgets.QApplication.quit()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if (event.type() == QtCore.QEvent.WindowStateChange and self.isMinimized() and
+                self.advanced_settings.get('low_memory_mode', False)):
+            # Nothing on screen needs the shared caches while we're minimised
+            _PREFETCHED_STILLS.clear()
+            purge_memory()
 
     def closeEvent(self, event):
-        try:
-            import keyboard
-            keyboard.unhook_all_hotkeys()
-        except ImportError:
-            pass
-        self.save_settings()
+        self.unregister_hotkey()
+        self._do_save_settings()
+        self.save_pool.waitForDone(1000)
         event.accept()
 
-    def increase_scale(self):
-        """
-        Increases the scale factor of the overlay image.
-        """
-        if self.scaling_mode == 'tile':
-            current_scale = self.advanced_settings.get('tile_scale', 1.0)
-            new_scale = current_scale + 0.1
-            if self.advanced_settings.get('enable_scale_limits', True):
-                new_scale = min(new_scale, 10.0)  
-            self.advanced_settings['tile_scale'] = new_scale
-        else:
-            new_scale = self.advanced_settings.get('scale_factor', 1.0) + 0.1
-            if self.advanced_settings.get('enable_scale_limits', True):
-                new_scale = min(new_scale, 10.0)  
-            self.advanced_settings['scale_factor'] = new_scale
+    def _adjust_scale(self, delta):
+        """Step the active scale setting by delta and push it to the visible overlay"""
+        adv = self.advanced_settings
+        overlay_window = self.overlay_window
+        key = 'tile_scale' if self._is_tile else 'scale_factor'
+        current_scale = adv[key]
+        new_scale = current_scale + delta
+        if self._clamp_enabled:
+            if new_scale > 10.0:
+                new_scale = 10.0
+            elif new_scale < 0.1:
+                new_scale = 0.1
+        if new_scale == current_scale:
+            return
+        adv[key] = new_scale
 
         self.save_settings()
+        # The overlay shares advanced_settings, so it already sees the new value;
+        # rebuild once per burst of wheel/hotkey steps rather than per step
+        if self.is_overlay_visible and overlay_window:
+            self.refresh_timer.start()
+
+    def refresh_overlay(self):
         if self.is_overlay_visible and self.overlay_window:
-            if self.scaling_mode == 'tile':
-                self.overlay_window.advanced_settings['tile_scale'] = self.advanced_settings['tile_scale']
-            else:
-                self.overlay_window.scale_factor = self.advanced_settings['scale_factor']
             self.overlay_window.initImage()
 
+    def increase_scale(self):
+        """
+        Increases the scale factor of the overlay image.
+        """
+        self._adjust_scale(0.1)
+
     def decrease_scale(self):
         """
         Decreases the scale factor of the overlay image.
         """
-        if self.scaling_mode == 'tile':
-            current_scale = self.advanced_settings.get('tile_scale', 1.0)
-            new_scale = current_scale - 0.1
-            if self.advanced_settings.get('enable_scale_limits', True):
-                new_scale = max(new_scale, 0.1)  
-            self.advanced_settings['tile_scale'] = new_scale
-        else:
-            new_scale = self.advanced_settings.get('scale_factor', 1.0) - 0.1
-            if self.advanced_settings.get('enable_scale_limits', True):
-                new_scale = max(new_scale, 0.1)  
-            self.advanced_settings['scale_factor'] = new_scale
-
-        self.save_settings()
-        if self.is_overlay_visible and self.overlay_window:
-            if self.scaling_mode == 'tile':
-                self.overlay_window.advanced_settings['tile_scale'] = self.advanced_settings['tile_scale']
-            else:
-                self.overlay_window.scale_factor = self.advanced_settings['scale_factor']
-            self.overlay_window.initImage()
-
+        self._adjust_scale(-0.1)
 
     def wheelEvent(self, event):
         
@@ -1566,4 +2355,9 @@ if __name__ == '__main__':
     QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
     app = QtWidgets.QApplication(sys.argv)
     ex = AnyOverlay()
+    signal.signal(signal.SIGINT, ex._signal_flush)
+    # Python only runs signal handlers between bytecodes, so wake the interpreter while the Qt loop idles
+    signal_timer = QtCore.QTimer()
+    signal_timer.timeout.connect(lambda: None)
+    signal_timer.start(250)
     sys.exit(app.exec_())
\ No newline at end of file